@@ -1,6 +1,7 @@
 # ruff: noqa: ERA001, E501
 """Base settings to build other settings files upon."""
 
+import ssl
 from pathlib import Path
 
 import environ
@@ -142,6 +143,7 @@ MIDDLEWARE = [
     "django.middleware.locale.LocaleMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
+    "getoutvideo_django.video_processor.middleware.ThrottleBlacklistMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
@@ -266,6 +268,57 @@ LOGGING = {
 REDIS_URL = env("REDIS_URL", default="redis://localhost:6379/0")
 REDIS_SSL = REDIS_URL.startswith("rediss://")
 
+# Celery
+# ------------------------------------------------------------------------------
+if USE_TZ:
+    # https://docs.celeryq.dev/en/stable/userguide/configuration.html#std:setting-timezone
+    CELERY_TIMEZONE = TIME_ZONE
+# https://docs.celeryq.dev/en/stable/userguide/configuration.html#std:setting-broker_url
+CELERY_BROKER_URL = REDIS_URL
+# https://docs.celeryq.dev/en/stable/userguide/configuration.html#redis-backend-use-ssl
+CELERY_BROKER_USE_SSL = {"ssl_cert_reqs": ssl.CERT_NONE} if REDIS_SSL else None
+# https://docs.celeryq.dev/en/stable/userguide/configuration.html#std:setting-result_backend
+CELERY_RESULT_BACKEND = REDIS_URL
+# https://docs.celeryq.dev/en/stable/userguide/configuration.html#redis-backend-use-ssl
+CELERY_REDIS_BACKEND_USE_SSL = CELERY_BROKER_USE_SSL
+# https://docs.celeryq.dev/en/stable/userguide/configuration.html#result-extended
+CELERY_RESULT_EXTENDED = True
+# https://docs.celeryq.dev/en/stable/userguide/configuration.html#result-backend-always-retry
+# https://github.com/celery/celery/pull/6122
+CELERY_RESULT_BACKEND_ALWAYS_RETRY = True
+# https://docs.celeryq.dev/en/stable/userguide/configuration.html#result-backend-max-retries
+CELERY_RESULT_BACKEND_MAX_RETRIES = 10
+# https://docs.celeryq.dev/en/stable/userguide/configuration.html#std:setting-accept_content
+CELERY_ACCEPT_CONTENT = ["json"]
+# https://docs.celeryq.dev/en/stable/userguide/configuration.html#std:setting-task_serializer
+CELERY_TASK_SERIALIZER = "json"
+# https://docs.celeryq.dev/en/stable/userguide/configuration.html#std:setting-result_serializer
+CELERY_RESULT_SERIALIZER = "json"
+# https://docs.celeryq.dev/en/stable/userguide/configuration.html#task-time-limit
+# Downloading, transcribing and rewriting a long video can take many minutes
+CELERY_TASK_TIME_LIMIT = 30 * 60
+# https://docs.celeryq.dev/en/stable/userguide/configuration.html#task-soft-time-limit
+# Leaves the task time to record the timeout on its job before the hard limit
+CELERY_TASK_SOFT_TIME_LIMIT = 29 * 60
+# https://docs.celeryq.dev/en/stable/userguide/configuration.html#task-track-started
+CELERY_TASK_TRACK_STARTED = True
+# https://docs.celeryq.dev/en/stable/userguide/configuration.html#task-routes
+# Video jobs run on dedicated workers: celery -A config.celery_app worker -Q video_processing
+CELERY_TASK_ROUTES = {
+    "getoutvideo_django.video_processor.tasks.process_video_task": {
+        "queue": "video_processing",
+    },
+    "getoutvideo_django.video_processor.tasks.route_video_task": {
+        "queue": "video_routing",
+    },
+}
+# https://docs.celeryq.dev/en/stable/userguide/configuration.html#worker-send-task-events
+CELERY_WORKER_SEND_TASK_EVENTS = True
+# https://docs.celeryq.dev/en/stable/userguide/configuration.html#std-setting-task_send_sent_event
+CELERY_TASK_SEND_SENT_EVENT = True
+# https://docs.celeryq.dev/en/stable/userguide/configuration.html#worker-hijack-root-logger
+CELERY_WORKER_HIJACK_ROOT_LOGGER = False
+
 
 # django-allauth
 # ------------------------------------------------------------------------------
@@ -299,9 +352,12 @@ REST_FRAMEWORK = {
     "DEFAULT_THROTTLE_RATES": {
         "anon": "100/day",
         "user": "1000/day",
+        # Processing a video downloads, transcribes and rewrites it, so the
+        # endpoint gets a much tighter per-client rate than everything else
+        "video_process": env.str("VIDEO_PROCESS_RATE", default="5/min"),
     },
     "DEFAULT_RENDERER_CLASSES": [
-        "rest_framework.renderers.JSONRenderer",
+        "getoutvideo_django.video_processor.renderers.ORJSONRenderer",
     ],
     "DEFAULT_PARSER_CLASSES": [
         "rest_framework.parsers.JSONParser",
@@ -314,7 +370,22 @@ REST_FRAMEWORK = {
 # ------------------------------------------------------------------------------
 GETOUTVIDEO_CONFIG = {
     "OPENAI_API_KEY": env.str("OPENAI_API_KEY", default=""),
+    # Reuse a pool of scratch directories for output files (e.g. /dev/shm/getoutvideo).
+    # Leave empty to use a fresh temporary directory per request.
+    "SCRATCH_DIR": env.str("GETOUTVIDEO_SCRATCH_DIR", default=""),
+    "SCRATCH_POOL_SIZE": env.int("GETOUTVIDEO_SCRATCH_POOL_SIZE", default=8),
+    # Keep processed styles on disk, keyed by a hash of video URL and language, so
+    # repeated requests and retries skip styles that are already done.
+    # Leave empty to process every request from scratch.
+    "RESULT_DIR": env.str("GETOUTVIDEO_RESULT_DIR", default=""),
 }
+# Seconds a successful video processing response is cached for identical requests
+VIDEO_RESULT_TTL = env.int("VIDEO_RESULT_TTL", default=60 * 60 * 24)
+# Videos up to this many seconds long are queued on VIDEO_SHORT_QUEUE, so they do
+# not wait behind long videos. Durations are probed by tasks on the
+# video_routing queue: celery -A config.celery_app worker -Q video_processing_short,video_routing
+VIDEO_SHORT_MAX_DURATION = env.int("VIDEO_SHORT_MAX_DURATION", default=5 * 60)
+VIDEO_SHORT_QUEUE = "video_processing_short"
 
 
 # Your stuff...
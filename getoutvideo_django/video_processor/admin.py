@@ -1 +1,11 @@
-# Register your models here.
+from django.contrib import admin
+
+from .models import VideoProcessingJob
+
+
+@admin.register(VideoProcessingJob)
+class VideoProcessingJobAdmin(admin.ModelAdmin):
+    list_display = ["video_url", "status", "output_language", "created_at"]
+    list_filter = ["status"]
+    search_fields = ["video_url"]
+    readonly_fields = ["id", "created_at", "updated_at"]
@@ -1,5 +1,3 @@
-import contextlib
-
 from django.apps import AppConfig
 from django.utils.translation import gettext_lazy as _
 
@@ -9,5 +7,4 @@ class VideoProcessorConfig(AppConfig):
     verbose_name = _("Video Processor")
 
     def ready(self):
-        with contextlib.suppress(ImportError):
-            import getoutvideo_django.video_processor.signals  # noqa: F401, PLC0415
+        import getoutvideo_django.video_processor.signals  # noqa: F401, PLC0415
@@ -3,6 +3,7 @@ Custom exception classes for the video_processor app.
 """
 
 from rest_framework import status
+from rest_framework.response import Response
 from rest_framework.views import exception_handler
 
 
@@ -47,19 +48,30 @@ class ConfigurationError(VideoProcessorError):
         super().__init__(message, status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
-def custom_exception_handler(exc, context):
-    """Custom exception handler for video processor exceptions."""
+_CUSTOM_EXCEPTION_TYPES = frozenset(
+    {
+        VideoProcessorError,
+        VideoValidationError,
+        ExternalServiceError,
+        ProcessingTimeoutError,
+        ConfigurationError,
+    },
+)
 
-    # Call REST framework's default exception handler first
-    response = exception_handler(exc, context)
 
-    # Handle our custom exceptions
-    if isinstance(exc, VideoProcessorError):
-        custom_response_data = {
-            "error": exc.message,
-            "status_code": exc.status_code,
-        }
-        response.data = custom_response_data
-        response.status_code = exc.status_code
+def custom_exception_handler(exc, context):
+    """Custom exception handler for video processor exceptions."""
 
-    return response
+    # Handle our custom exceptions; the exact-type lookup covers the known
+    # classes and isinstance() catches any subclasses added later
+    if type(exc) in _CUSTOM_EXCEPTION_TYPES or isinstance(exc, VideoProcessorError):
+        return Response(
+            {
+                "error": exc.message,
+                "status_code": exc.status_code,
+            },
+            status=exc.status_code,
+        )
+
+    # Fall back to REST framework's default exception handler
+    return exception_handler(exc, context)
@@ -0,0 +1,81 @@
+"""
+Middleware for the video_processor app.
+"""
+
+import hashlib
+import math
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import JsonResponse
+from django.utils.http import parse_http_date_safe
+from rest_framework import status
+from rest_framework.throttling import BaseThrottle
+
+# Only used for get_ident(), which reads the client address the same way DRF's
+# throttles do, honouring NUM_PROXIES and X-Forwarded-For
+_IDENT_THROTTLE = BaseThrottle()
+
+
+def _blacklist_key(request) -> str:
+    """
+    Return the cache key identifying the client and path of a request.
+
+    Session and token clients are told apart by their credentials, so users
+    sharing an address are blacklisted separately; everyone else by the
+    address DRF's throttles identify them by. Each credential belongs to a
+    single user, so a blacklisted client is always one DRF would throttle too.
+    """
+    client = request.META.get("HTTP_AUTHORIZATION") or request.COOKIES.get(
+        settings.SESSION_COOKIE_NAME,
+    )
+    if not client:
+        client = f"addr:{_IDENT_THROTTLE.get_ident(request)}"
+    digest = hashlib.sha256(f"{client}|{request.path}".encode())
+    return f"bl:{digest.hexdigest()}"
+
+
+def _retry_after_seconds(value: str) -> int:
+    """Return the wait a Retry-After header asks for, in seconds, or 0."""
+    try:
+        return int(value)
+    except ValueError:
+        # Retry-After may also be an HTTP date
+        retry_at = parse_http_date_safe(value)
+        if retry_at is None:
+            return 0
+        return math.ceil(retry_at - time.time())
+
+
+class ThrottleBlacklistMiddleware:
+    """
+    Turn throttled clients away before their requests reach DRF.
+
+    When a view answers 429 with a Retry-After header, the client is
+    blacklisted for that path until the wait is over. Its further requests are
+    rejected after a single cache lookup instead of going through
+    authentication, parsing and throttle checks again.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        key = _blacklist_key(request)
+        blocked_until = cache.get(key)
+        if blocked_until is not None:
+            response = JsonResponse(
+                {"detail": "Request was throttled."},
+                status=status.HTTP_429_TOO_MANY_REQUESTS,
+            )
+            response["Retry-After"] = max(1, math.ceil(blocked_until - time.time()))
+            return response
+
+        response = self.get_response(request)
+
+        if response.status_code == status.HTTP_429_TOO_MANY_REQUESTS:
+            wait = _retry_after_seconds(response.get("Retry-After", "0"))
+            if wait > 0:
+                cache.set(key, time.time() + wait, timeout=wait)
+        return response
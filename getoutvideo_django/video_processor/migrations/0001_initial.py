@@ -0,0 +1,80 @@
+import uuid
+
+from django.db import migrations
+from django.db import models
+
+
+class Migration(migrations.Migration):
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="VideoProcessingJob",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                (
+                    "video_url",
+                    models.URLField(max_length=2048, verbose_name="Video URL"),
+                ),
+                (
+                    "styles",
+                    models.JSONField(blank=True, null=True, verbose_name="Styles"),
+                ),
+                (
+                    "output_language",
+                    models.CharField(
+                        default="English", max_length=50, verbose_name="Output language"
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "Pending"),
+                            ("processing", "Processing"),
+                            ("success", "Success"),
+                            ("failure", "Failure"),
+                        ],
+                        default="pending",
+                        max_length=20,
+                        verbose_name="Status",
+                    ),
+                ),
+                (
+                    "result",
+                    models.JSONField(blank=True, null=True, verbose_name="Result"),
+                ),
+                (
+                    "error_message",
+                    models.TextField(blank=True, verbose_name="Error message"),
+                ),
+                (
+                    "error_code",
+                    models.PositiveSmallIntegerField(
+                        blank=True, null=True, verbose_name="Error code"
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="Created at"),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(auto_now=True, verbose_name="Updated at"),
+                ),
+            ],
+            options={
+                "ordering": ["-created_at"],
+            },
+        ),
+    ]
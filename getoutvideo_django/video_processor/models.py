@@ -1 +1,91 @@
-# Create your models here.
+import uuid
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import models
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+
+class VideoProcessingJob(models.Model):
+    """
+    A queued video processing request and its outcome.
+
+    Celery tasks receive only the job's primary key and read the processing
+    inputs from here; the worker writes the result or error back, and the
+    status endpoints read the job directly.
+    """
+
+    class Status(models.TextChoices):
+        PENDING = "pending", _("Pending")
+        PROCESSING = "processing", _("Processing")
+        SUCCESS = "success", _("Success")
+        FAILURE = "failure", _("Failure")
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    video_url = models.URLField(_("Video URL"), max_length=2048)
+    styles = models.JSONField(_("Styles"), null=True, blank=True)
+    output_language = models.CharField(
+        _("Output language"),
+        max_length=50,
+        default="English",
+    )
+    status = models.CharField(
+        _("Status"),
+        max_length=20,
+        choices=Status.choices,
+        default=Status.PENDING,
+    )
+    result = models.JSONField(_("Result"), null=True, blank=True)
+    error_message = models.TextField(_("Error message"), blank=True)
+    error_code = models.PositiveSmallIntegerField(
+        _("Error code"),
+        null=True,
+        blank=True,
+    )
+    created_at = models.DateTimeField(_("Created at"), auto_now_add=True)
+    updated_at = models.DateTimeField(_("Updated at"), auto_now=True)
+
+    class Meta:
+        ordering = ["-created_at"]
+
+    def __str__(self) -> str:
+        return f"{self.video_url} ({self.status})"
+
+    @property
+    def is_finished(self) -> bool:
+        """Whether the worker has recorded a result or an error."""
+        return self.status in {self.Status.SUCCESS, self.Status.FAILURE}
+
+    @property
+    def is_abandoned(self) -> bool:
+        """
+        Whether the job's worker died before recording an outcome.
+
+        Workers are killed once a task has run for CELERY_TASK_TIME_LIMIT, so
+        a job still processing that long after it was picked up has no worker
+        left to finish it.
+        """
+        time_limit = timedelta(seconds=settings.CELERY_TASK_TIME_LIMIT)
+        return (
+            self.status == self.Status.PROCESSING
+            and timezone.now() - self.updated_at > time_limit
+        )
+
+    def mark_processing(self) -> None:
+        """Record that a worker has picked the job up."""
+        self.status = self.Status.PROCESSING
+        self.save(update_fields=["status", "updated_at"])
+
+    def mark_success(self, result: dict) -> None:
+        """Record the processed video data."""
+        self.status = self.Status.SUCCESS
+        self.result = result
+        self.save(update_fields=["status", "result", "updated_at"])
+
+    def mark_failure(self, message: str, code: int) -> None:
+        """Record the error response the job ended with."""
+        self.status = self.Status.FAILURE
+        self.error_message = message
+        self.error_code = code
+        self.save(update_fields=["status", "error_message", "error_code", "updated_at"])
@@ -0,0 +1,30 @@
+"""
+Response renderers for the video_processor app.
+"""
+
+import orjson
+from rest_framework.renderers import BaseRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+
+class ORJSONRenderer(BaseRenderer):
+    """
+    JSON renderer backed by orjson.
+
+    Processed video responses carry several long text fields, which orjson
+    encodes considerably faster than the standard library encoder. Types that
+    orjson does not support natively (lazy translations, Decimal, ...) are
+    delegated to DRF's JSON encoder.
+    """
+
+    media_type = "application/json"
+    format = "json"
+    charset = None
+
+    _default = staticmethod(JSONEncoder().default)
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """Render data into JSON bytes."""
+        if data is None:
+            return b""
+        return orjson.dumps(data, default=self._default, option=orjson.OPT_UTC_Z)
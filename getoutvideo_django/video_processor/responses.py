@@ -0,0 +1,42 @@
+"""
+Success payloads shared by the API views and the processing task.
+"""
+
+import hashlib
+from typing import Any
+
+from .serializers import VideoProcessResponseSerializer
+
+# Unbound serializer reused to validate every success payload; its field tree
+# is built once, and run_validation() keeps no per-call state, so one instance
+# is safe to share across requests and tasks
+_RESPONSE_SERIALIZER = VideoProcessResponseSerializer()
+
+
+def result_cache_key(
+    video_url: str,
+    styles: list[str] | None,
+    output_language: str,
+) -> str:
+    """Return the cache key for the response to a set of processing inputs."""
+    digest = hashlib.sha256(
+        f"{video_url}|{output_language}|{sorted(styles or [])}".encode(),
+    )
+    return f"vp:{digest.hexdigest()}"
+
+
+def success_payload(result_data: dict[str, Any]) -> dict[str, Any]:
+    """
+    Return the validated success response for processed video data.
+
+    The payload is returned in JSON-ready form, so it can be cached and
+    stored on a job as is; fields the response format does not define are
+    dropped.
+
+    Raises:
+        serializers.ValidationError: If the data does not match the response format
+    """
+    validated_data = _RESPONSE_SERIALIZER.run_validation(
+        {"status": "success", "data": result_data},
+    )
+    return _RESPONSE_SERIALIZER.to_representation(validated_data)
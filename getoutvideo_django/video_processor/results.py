@@ -0,0 +1,83 @@
+"""
+Content-addressed storage for processed video results.
+"""
+
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+
+_TITLE_FILE = "title.txt"
+
+
+class StyleResultStore:
+    """
+    Processed style outputs stored on disk, keyed by a hash of their inputs.
+
+    Each (video URL, output language) pair owns one directory holding the
+    video title and one file per result key. A style that already has a file
+    is never sent to the SDK again, so repeated requests and retries after a
+    partial failure only process the styles that are still missing.
+    """
+
+    def __init__(self, root: str):
+        self._root = Path(root)
+        self._root.mkdir(parents=True, exist_ok=True)
+
+    def _entry_dir(self, video_url: str, output_language: str) -> Path:
+        """Return the directory addressed by the hash of the shared inputs."""
+        digest = hashlib.sha256(f"{video_url}|{output_language}".encode())
+        return self._root / digest.hexdigest()
+
+    def load(
+        self,
+        video_url: str,
+        output_language: str,
+        result_keys: list[str],
+    ) -> tuple[dict[str, str], str | None]:
+        """Return the stored results among result_keys and the stored title."""
+        entry_dir = self._entry_dir(video_url, output_language)
+        title = _read_text(entry_dir / _TITLE_FILE)
+        if title is None:
+            return {}, None
+
+        results = {}
+        for result_key in result_keys:
+            content = _read_text(entry_dir / f"{result_key}.md")
+            if content is not None:
+                results[result_key] = content
+        return results, title
+
+    def save(
+        self,
+        video_url: str,
+        output_language: str,
+        title: str,
+        results: dict[str, str],
+    ) -> None:
+        """Store results, writing the title last so readers never see half."""
+        entry_dir = self._entry_dir(video_url, output_language)
+        entry_dir.mkdir(exist_ok=True)
+        for result_key, content in results.items():
+            _write_text_atomic(entry_dir / f"{result_key}.md", content)
+        _write_text_atomic(entry_dir / _TITLE_FILE, title)
+
+
+def _read_text(path: Path) -> str | None:
+    """Read a stored file, returning None if it does not exist."""
+    try:
+        return path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return None
+
+
+def _write_text_atomic(path: Path, content: str) -> None:
+    """Write content to path via a rename, so partial files are never read."""
+    fd, temp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(content)
+        Path(temp_path).replace(path)
+    except BaseException:
+        Path(temp_path).unlink(missing_ok=True)
+        raise
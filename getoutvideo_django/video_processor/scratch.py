@@ -0,0 +1,105 @@
+"""
+Reusable scratch directories for GetOutVideo output files.
+"""
+
+import contextlib
+import fcntl
+import os
+import queue
+import shutil
+import tempfile
+import weakref
+from collections.abc import Iterator
+from pathlib import Path
+
+
+class ScratchDirectoryPool:
+    """
+    Fixed set of persistent scratch directories handed out one per request.
+
+    Directories are emptied and returned to the pool after use instead of being
+    created and removed for every request. When every slot is taken, a regular
+    temporary directory is used instead.
+    """
+
+    def __init__(self, root: str, size: int):
+        Path(root).mkdir(parents=True, exist_ok=True)
+        _remove_stale_pools(Path(root))
+        # Each process gets its own subdirectory so workers never share slots.
+        # It holds a lock on the directory for as long as it is in use, so
+        # later pools, even ones in other containers sharing the root, can
+        # tell abandoned directories from live ones. The directory is locked
+        # before it is given a name they look at
+        new_dir = tempfile.mkdtemp(prefix=".pool-", dir=root)
+        lock_fd = _lock_directory(new_dir)
+        base = Path(root) / Path(new_dir).name.removeprefix(".")
+        Path(new_dir).rename(base)
+        # Removed when the pool is collected or the process exits normally.
+        # The lock of a process killed without cleaning up (e.g. a Celery
+        # child, which leaves through os._exit) is released with it, and its
+        # directory goes when the next pool starts
+        weakref.finalize(self, _remove_pool, base, lock_fd)
+
+        self._slots: queue.SimpleQueue[Path] = queue.SimpleQueue()
+        for index in range(size):
+            slot = base / f"slot-{index}"
+            slot.mkdir()
+            self._slots.put(slot)
+
+    @contextlib.contextmanager
+    def acquire(self) -> Iterator[str]:
+        """Yield an empty scratch directory path for the duration of the block."""
+        try:
+            slot = self._slots.get_nowait()
+        except queue.Empty:
+            with tempfile.TemporaryDirectory() as temp_dir:
+                yield temp_dir
+            return
+
+        try:
+            yield str(slot)
+        finally:
+            self._clear(slot)
+            self._slots.put(slot)
+
+    @staticmethod
+    def _clear(slot: Path) -> None:
+        """Remove everything inside a slot, keeping the slot itself."""
+        for path in slot.iterdir():
+            if path.is_dir() and not path.is_symlink():
+                shutil.rmtree(path)
+            else:
+                path.unlink()
+
+
+def _lock_directory(path: str | Path) -> int:
+    """
+    Take an exclusive lock on a directory and return the descriptor holding it.
+
+    Raises:
+        BlockingIOError: If another open descriptor holds the lock
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BaseException:
+        os.close(fd)
+        raise
+    return fd
+
+
+def _remove_pool(path: Path, lock_fd: int) -> None:
+    """Remove a pool directory, then release the lock held on it."""
+    shutil.rmtree(path, ignore_errors=True)
+    os.close(lock_fd)
+
+
+def _remove_stale_pools(root: Path) -> None:
+    """Remove pool directories no running process holds the lock on."""
+    for path in root.glob("pool-*"):
+        try:
+            lock_fd = _lock_directory(path)
+        except (BlockingIOError, FileNotFoundError):
+            # In use, or already removed by another process
+            continue
+        _remove_pool(path, lock_fd)
@@ -6,12 +6,42 @@ import re
 
 from rest_framework import serializers
 
+# Every quantifier is bounded and the query-string segments are delimited by
+# "&", which the segment class cannot match, so matching stays linear in the
+# length of the URL no matter what the input looks like.
+_match_youtube_url = re.compile(
+    r"\Ahttps?://(?:"
+    r"(?:www\.|m\.)?youtube\.com/(?:"
+    r"watch\?(?:[^#&]{0,256}&){0,16}v=[\w-]{1,32}"
+    r"|embed/[\w-]{1,32}"
+    r"|v/[\w-]{1,32}"
+    r")"
+    r"|youtu\.be/[\w-]{1,32}"
+    r")",
+).match
+_YOUTUBE_URL_PREFIXES = tuple(
+    f"{scheme}://{host}/"
+    for scheme in ("https", "http")
+    for host in ("www.youtube.com", "youtube.com", "m.youtube.com", "youtu.be")
+)
+_VIDEO_URL_MAX_LENGTH = 2048
+
+_VALID_STYLES = (
+    "Summary",
+    "Educational",
+    "Balanced",
+    "QA Generation",
+    "Narrative",
+)
+_VALID_STYLES_SET = frozenset(_VALID_STYLES)
+
 
 class VideoProcessRequestSerializer(serializers.Serializer):
     """Serializer for video processing request data."""
 
     video_url = serializers.URLField(
         required=True,
+        max_length=_VIDEO_URL_MAX_LENGTH,
         help_text="YouTube video URL to process",
     )
     styles = serializers.ListField(
@@ -40,16 +70,13 @@ class VideoProcessRequestSerializer(serializers.Serializer):
         Raises:
             serializers.ValidationError: If URL is not a valid YouTube URL
         """
-        youtube_patterns = [
-            r"^https?://(www\.)?youtube\.com/watch\?v=[\w-]+",
-            r"^https?://(www\.)?youtube\.com/watch\?.*v=[\w-]+",
-            r"^https?://youtu\.be/[\w-]+",
-            r"^https?://(www\.)?youtube\.com/embed/[\w-]+",
-            r"^https?://(www\.)?youtube\.com/v/[\w-]+",
-        ]
-
-        if not any(re.match(pattern, value) for pattern in youtube_patterns):
-            msg = "Invalid YouTube URL. Please provide a valid YouTube video URL."
+        msg = "Invalid YouTube URL. Please provide a valid YouTube video URL."
+
+        # Cheap prefix check rejects non-YouTube URLs before the regex runs
+        if not value.startswith(_YOUTUBE_URL_PREFIXES):
+            raise serializers.ValidationError(msg)
+
+        if not _match_youtube_url(value):
             raise serializers.ValidationError(msg)
 
         return value
@@ -70,19 +97,11 @@ class VideoProcessRequestSerializer(serializers.Serializer):
         if value is None:
             return []
 
-        valid_styles = [
-            "Summary",
-            "Educational",
-            "Balanced",
-            "QA Generation",
-            "Narrative",
-        ]
-
         for style in value:
-            if style not in valid_styles:
+            if style not in _VALID_STYLES_SET:
                 error_msg = (
                     f"Invalid style '{style}'. "
-                    f"Valid styles are: {', '.join(valid_styles)}"
+                    f"Valid styles are: {', '.join(_VALID_STYLES)}"
                 )
                 raise serializers.ValidationError(error_msg)
 
@@ -2,20 +2,243 @@
 Business logic layer for video processing operations.
 """
 
+import asyncio
+import contextlib
+import functools
+import re
 import tempfile
+import threading
 import time
-from datetime import UTC
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
+from typing import NoReturn
 
+import openai
+import yt_dlp
 from django.conf import settings
+from getoutvideo import AIProcessor
+from getoutvideo import APIConfig
 from getoutvideo import GetOutVideoAPI
+from getoutvideo import ProcessingConfig
 
 from .exceptions import ConfigurationError
 from .exceptions import ExternalServiceError
 from .exceptions import ProcessingTimeoutError
 from .exceptions import VideoValidationError
+from .results import StyleResultStore
+from .scratch import ScratchDirectoryPool
+
+# Normalized style name -> result key
+_NORM_TO_RESULT = {
+    "balanced_and_detailed": "balanced",
+    "summary": "summary",
+    "educational": "educational",
+    "narrative_rewriting": "narrative",
+    "q&a_generation": "qa_generation",
+    "qanda_generation": "qa_generation",
+}
+
+# Output files are read concurrently once there are enough of them to matter
+_PARALLEL_READ_MIN_FILES = 3
+_MAX_READ_WORKERS = 8
+_READ_BUFFER_SIZE = 64 * 1024
+_DEFAULT_SCRATCH_POOL_SIZE = 8
+_STYLES_CACHE_TTL_SECONDS = 3600
+_PROCESSED_AT_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+# The socket timeout bounds each network read, so an unresponsive host cannot
+# hold the probing worker
+_DURATION_PROBE_OPTIONS = {
+    "quiet": True,
+    "no_warnings": True,
+    "skip_download": True,
+    "socket_timeout": 10,
+}
+
+# SDK error messages are categorized by the first of these patterns they
+# match, in priority order; the pattern selects the exception type and message
+# raised in its place
+_ERROR_CATEGORIES = (
+    (
+        re.compile(r"invalid url|not found|unavailable", re.IGNORECASE),
+        VideoValidationError,
+        "Invalid or inaccessible video URL: {video_url}",
+    ),
+    (
+        re.compile(r"timeout", re.IGNORECASE),
+        ProcessingTimeoutError,
+        "Video processing timed out",
+    ),
+    (
+        re.compile(r"api key|authentication", re.IGNORECASE),
+        ConfigurationError,
+        "API authentication failed",
+    ),
+)
+
+# Errors raised by the service itself, passed to callers unchanged
+_SERVICE_ERRORS = (
+    VideoValidationError,
+    ExternalServiceError,
+    ProcessingTimeoutError,
+    ConfigurationError,
+)
+
+_api_clients: dict[str, GetOutVideoAPI] = {}
+_api_clients_lock = threading.Lock()
+_openai_clients: dict[str, openai.OpenAI] = {}
+_openai_clients_lock = threading.Lock()
+
+
+def _get_api_client(api_key: str) -> GetOutVideoAPI:
+    """
+    Return the process-wide GetOutVideo client for an API key.
+
+    The client is shared by every thread in the process, so only its
+    stateless calls may be used on it: extract_transcripts without a config
+    and get_available_styles. process_youtube_url and process_with_ai write
+    the request's styles and language onto the client's shared configuration,
+    so concurrent callers could pick up each other's settings; styles are
+    processed through per-call processors instead (see _stylize).
+    """
+    client = _api_clients.get(api_key)
+    if client is None:
+        with _api_clients_lock:
+            client = _api_clients.get(api_key)
+            if client is None:
+                client = GetOutVideoAPI(openai_api_key=api_key)
+                _api_clients[api_key] = client
+    return client
+
+
+def _get_openai_client(api_key: str) -> openai.OpenAI:
+    """
+    Return the process-wide OpenAI client for an API key.
+
+    The client owns a pool of keep-alive connections, so sharing it lets
+    concurrent and later requests skip the TLS handshake to the API. OpenAI
+    clients are safe to use from several threads at once.
+    """
+    client = _openai_clients.get(api_key)
+    if client is None:
+        with _openai_clients_lock:
+            client = _openai_clients.get(api_key)
+            if client is None:
+                client = openai.OpenAI(api_key=api_key)
+                _openai_clients[api_key] = client
+    return client
+
+
+class _PooledAIProcessor(AIProcessor):
+    """
+    AIProcessor that talks to the API through a shared OpenAI client.
+
+    AIProcessor.__init__ builds a new OpenAI client, and with it a new
+    connection pool, for every processor; this takes the pooled client instead.
+    """
+
+    def __init__(self, config: APIConfig, client: openai.OpenAI):
+        # Sets what AIProcessor.__init__ does, except for building a client
+        self.config = config
+        self._cancelled = False
+        self.client = client
+
+
+def _styles_ttl_bucket() -> int:
+    """Return the current style cache period; a new period invalidates the cache."""
+    return int(time.monotonic() // _STYLES_CACHE_TTL_SECONDS)
+
+
+@functools.lru_cache(maxsize=1)
+def _fetch_style_catalog(
+    api: GetOutVideoAPI,
+    ttl_bucket: int,
+) -> tuple[tuple[str, ...], frozenset[str]]:
+    """Fetch the style catalog once per API client and cache period."""
+    styles = tuple(api.get_available_styles())
+    return styles, frozenset(styles)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_config() -> dict[str, Any]:
+    """Return GETOUTVIDEO_CONFIG, read from settings once per process."""
+    return settings.GETOUTVIDEO_CONFIG
+
+
+@functools.lru_cache(maxsize=1)
+def _get_scratch_pool(root: str, size: int) -> ScratchDirectoryPool:
+    """Build the scratch directory pool on first use."""
+    return ScratchDirectoryPool(root, size)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_result_store(root: str) -> StyleResultStore:
+    """Build the result store on first use."""
+    return StyleResultStore(root)
+
+
+def _result_store() -> StyleResultStore | None:
+    """Return the configured result store, or None when results are not kept."""
+    result_root = _get_config().get("RESULT_DIR")
+    if not result_root:
+        return None
+    return _get_result_store(result_root)
+
+
+def _scratch_directory() -> contextlib.AbstractContextManager[str]:
+    """Return a context manager yielding a directory for SDK output files."""
+    config = _get_config()
+    scratch_root = config.get("SCRATCH_DIR")
+    if not scratch_root:
+        return tempfile.TemporaryDirectory()
+    pool_size = config.get("SCRATCH_POOL_SIZE", _DEFAULT_SCRATCH_POOL_SIZE)
+    return _get_scratch_pool(scratch_root, pool_size).acquire()
+
+
+def _normalize_style(style: str) -> str:
+    """Normalize a style name for lookups in _NORM_TO_RESULT."""
+    return style.lower().replace(" ", "_")
+
+
+def _result_key(style: str) -> str:
+    """Return the results dict key for a style name."""
+    style_norm = _normalize_style(style)
+    # Unknown styles fall back to the cleaned style name as key
+    return _NORM_TO_RESULT.get(style_norm, style_norm.replace("&", "and"))
+
+
+def _split_output_stem(stem: str) -> tuple[str, str] | None:
+    """
+    Split an output file name (without extension) into video title and style.
+
+    Handles the SDK's "<title> [<style>]" naming as well as "<title>_<style>",
+    where the longest trailing run of parts naming a known style wins so that
+    titles containing underscores are kept intact.
+    """
+    if stem.endswith("]") and " [" in stem:
+        title, _, style = stem[:-1].rpartition(" [")
+        return title, style
+
+    parts = stem.split("_")
+    min_parts = 2
+    if len(parts) < min_parts:
+        return None
+
+    for index in range(1, len(parts)):
+        style = "_".join(parts[index:])
+        if _normalize_style(style) in _NORM_TO_RESULT:
+            return "_".join(parts[:index]), style
+
+    return parts[0], "_".join(parts[1:])
+
+
+def _read_output_file(file_path: Path) -> str | None:
+    """Read an output file, returning None if it was not written."""
+    try:
+        with file_path.open(encoding="utf-8", buffering=_READ_BUFFER_SIZE) as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
 
 
 class VideoProcessingService:
@@ -23,33 +246,52 @@ class VideoProcessingService:
 
     def __init__(self):
         """Initialize the service with GetOutVideo API."""
-        api_key = settings.GETOUTVIDEO_CONFIG.get("OPENAI_API_KEY")
+        api_key = _get_config().get("OPENAI_API_KEY")
         if not api_key:
             msg = "OPENAI_API_KEY not configured"
             raise ConfigurationError(msg)
 
+        self._api_key = api_key
         try:
-            self.api = GetOutVideoAPI(openai_api_key=api_key)
+            self.api = _get_api_client(api_key)
         except Exception as e:
             msg = f"Failed to initialize GetOutVideo API: {e}"
             raise ConfigurationError(msg) from e
 
     def get_available_styles(self) -> list[str]:
         """Get list of available processing styles from the API."""
+        available_styles, _ = self._get_style_catalog()
+        return list(available_styles)
+
+    def _get_style_catalog(self) -> tuple[tuple[str, ...], frozenset[str]]:
+        """Get the cached style catalog as an ordered tuple and a lookup set."""
         try:
-            return self.api.get_available_styles()
+            return _fetch_style_catalog(self.api, _styles_ttl_bucket())
         except Exception as e:
             msg = f"Failed to get available styles: {e}"
             raise ExternalServiceError(msg) from e
 
+    def get_video_duration(self, video_url: str) -> int | None:
+        """
+        Return the video's duration in seconds, or None if it cannot be read.
+
+        Only the video's metadata is fetched; nothing is downloaded.
+        """
+        try:
+            with yt_dlp.YoutubeDL(_DURATION_PROBE_OPTIONS) as ydl:
+                info = ydl.extract_info(video_url, download=False, process=False)
+        except (yt_dlp.utils.YoutubeDLError, OSError):
+            return None
+        return info.get("duration") if info else None
+
     def _validate_styles(self, styles: list[str]) -> None:
         """Validate styles against available ones."""
-        available_styles = self.get_available_styles()
-        invalid_styles = [s for s in styles if s not in available_styles]
+        available_styles, available_style_set = self._get_style_catalog()
+        invalid_styles = set(styles) - available_style_set
         if invalid_styles:
             msg = (
-                f"Invalid styles: {invalid_styles}. "
-                f"Available styles: {available_styles}"
+                f"Invalid styles: {sorted(invalid_styles)}. "
+                f"Available styles: {list(available_styles)}"
             )
             raise VideoValidationError(msg)
 
@@ -61,68 +303,209 @@ class VideoProcessingService:
         results = {}
         video_title = "Unknown Title"
 
-        style_mapping = {
-            "Balanced and Detailed": "balanced",
-            "Summary": "summary",
-            "Educational": "educational",
-            "Narrative Rewriting": "narrative",
-            "Q&A Generation": "qa_generation",
-        }
+        file_paths = [Path(file_path_str) for file_path_str in output_files]
+        if len(file_paths) >= _PARALLEL_READ_MIN_FILES:
+            max_workers = min(_MAX_READ_WORKERS, len(file_paths))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                contents = list(executor.map(_read_output_file, file_paths))
+        else:
+            contents = [_read_output_file(file_path) for file_path in file_paths]
+
+        for file_path, content in zip(file_paths, contents, strict=True):
+            if content is None:
+                continue
 
-        for file_path_str in output_files:
-            file_path = Path(file_path_str)
-            if file_path.exists():
-                content = file_path.read_text(encoding="utf-8")
-                filename = file_path.stem
-
-                if "_" in filename:
-                    parts = filename.split("_")
-                    min_parts = 2
-                    if len(parts) >= min_parts:
-                        video_title = parts[0]
-                        style = "_".join(parts[1:])
-
-                        # Find matching style (case-insensitive)
-                        result_key = None
-                        for api_style, result_style in style_mapping.items():
-                            if api_style.lower().replace(
-                                " ",
-                                "_",
-                            ) in style.lower().replace(" ", "_"):
-                                result_key = result_style
-                                break
-
-                        if result_key:
-                            results[result_key] = content
-                        else:
-                            # Fallback: use cleaned style name as key
-                            result_key = (
-                                style.lower().replace(" ", "_").replace("&", "and")
-                            )
-                            results[result_key] = content
+            split = _split_output_stem(file_path.stem)
+            if split is None:
+                continue
+
+            video_title, style = split
+            results[_result_key(style)] = content
 
         return results, video_title
 
-    def _handle_processing_error(self, e: Exception, video_url: str) -> None:
+    def _handle_processing_error(self, e: Exception, video_url: str) -> NoReturn:
         """Handle different types of processing errors."""
-        error_msg = str(e).lower()
-        if (
-            "invalid url" in error_msg
-            or "not found" in error_msg
-            or "unavailable" in error_msg
-        ):
-            msg = f"Invalid or inaccessible video URL: {video_url}"
-            raise VideoValidationError(msg) from e
-        if "timeout" in error_msg:
-            msg = "Video processing timed out"
-            raise ProcessingTimeoutError(msg) from e
-        if "api key" in error_msg or "authentication" in error_msg:
-            msg = "API authentication failed"
-            raise ConfigurationError(msg) from e
+        error_msg = str(e)
+        for pattern, error_class, template in _ERROR_CATEGORIES:
+            if pattern.search(error_msg):
+                msg = template.format(video_url=video_url)
+                raise error_class(msg) from e
         msg = f"External service error: {e}"
         raise ExternalServiceError(msg) from e
 
-    def process_video(
+    def _load_stored_results(
+        self,
+        video_url: str,
+        styles: list[str],
+        output_language: str,
+    ) -> tuple[dict[str, str], str | None, list[str]]:
+        """
+        Load results stored by earlier requests.
+
+        Returns the stored results, the stored video title and the styles that
+        still have to be processed.
+        """
+        store = _result_store()
+        results: dict[str, str] = {}
+        video_title: str | None = None
+        if store is not None:
+            results, video_title = store.load(
+                video_url,
+                output_language,
+                [_result_key(style) for style in styles],
+            )
+        missing_styles = [
+            style for style in styles if _result_key(style) not in results
+        ]
+        return results, video_title, missing_styles
+
+    def _merge_new_results(
+        self,
+        video_url: str,
+        output_language: str,
+        output_files: list[str],
+        results: dict[str, str],
+        video_title: str | None,
+    ) -> str | None:
+        """Parse new output files into results, store them and return the title."""
+        new_results, new_title = self._parse_output_files(output_files)
+        if not new_results:
+            return video_title
+
+        results.update(new_results)
+        store = _result_store()
+        if store is not None:
+            store.save(video_url, output_language, new_title, new_results)
+        return new_title
+
+    async def _process_styles(
+        self,
+        video_url: str,
+        styles: list[str],
+        output_language: str,
+        results: dict[str, str],
+        video_title: str | None,
+    ) -> str | None:
+        """Process styles concurrently, merge them into results and return the title."""
+        # The SDK calls block, so they run on threads of an executor owned by
+        # this call. asyncio.run() waits for the loop's default executor when
+        # it closes, so with to_thread() a soft time limit interrupting
+        # processing was only handled once every running call had ended
+        loop = asyncio.get_running_loop()
+        executor = ThreadPoolExecutor(max_workers=len(styles))
+        try:
+            transcripts = await loop.run_in_executor(
+                executor,
+                self.api.extract_transcripts,
+                video_url,
+            )
+            with _scratch_directory() as temp_dir:
+                style_outputs = await asyncio.gather(
+                    *(
+                        loop.run_in_executor(
+                            executor,
+                            self._stylize,
+                            transcripts,
+                            style,
+                            output_language,
+                            temp_dir,
+                        )
+                        for style in styles
+                    ),
+                )
+                return self._merge_new_results(
+                    video_url,
+                    output_language,
+                    [path for paths in style_outputs for path in paths],
+                    results,
+                    video_title,
+                )
+        finally:
+            # Calls still running when processing is interrupted are left to
+            # finish on their own instead of holding up the interruption
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _stylize(
+        self,
+        transcripts: list[Any],
+        style: str,
+        output_language: str,
+        output_dir: str,
+    ) -> list[str]:
+        """Process transcripts in a single style and return the output files."""
+        # A processor per call, since the SDK keeps the styles to process on
+        # the processor's configuration
+        processor = _PooledAIProcessor(
+            APIConfig(
+                openai_api_key=self._api_key,
+                processing_config=ProcessingConfig(
+                    output_language=output_language,
+                    styles=[style],
+                ),
+            ),
+            _get_openai_client(self._api_key),
+        )
+        results = processor.process_transcripts(transcripts, output_dir)
+        return [result.output_file_path for result in results]
+
+    def find_stored_result(
+        self,
+        video_url: str,
+        styles: list[str] | None = None,
+        output_language: str = "English",
+    ) -> dict[str, Any] | None:
+        """
+        Return the result for a request whose styles are all stored already.
+
+        Returns None when results are not kept or any style is still missing,
+        in which case the video has to go through aprocess_video.
+        """
+        store = _result_store()
+        if store is None:
+            return None
+
+        start_ns = time.perf_counter_ns()
+        if styles is None:
+            styles = self.get_available_styles()
+        result_keys = [_result_key(style) for style in styles]
+        results, video_title = store.load(video_url, output_language, result_keys)
+        if video_title is None or any(key not in results for key in result_keys):
+            return None
+
+        return self._build_result(
+            video_url,
+            video_title,
+            results,
+            output_language,
+            styles,
+            start_ns,
+        )
+
+    def _build_result(  # noqa: PLR0913
+        self,
+        video_url: str,
+        video_title: str,
+        results: dict[str, str],
+        output_language: str,
+        styles: list[str],
+        start_ns: int,
+    ) -> dict[str, Any]:
+        """Assemble the processed video data returned to callers."""
+        processing_time = (time.perf_counter_ns() - start_ns) / 1e9
+        return {
+            "video_url": video_url,
+            "video_title": video_title.replace("_", " "),
+            "processed_at": time.strftime(_PROCESSED_AT_FORMAT, time.gmtime()),
+            "results": results,
+            "metadata": {
+                "processing_time": round(processing_time, 2),
+                "language": output_language,
+                "styles_processed": styles,
+            },
+        }
+
+    async def aprocess_video(
         self,
         video_url: str,
         styles: list[str] | None = None,
@@ -131,6 +514,10 @@ class VideoProcessingService:
         """
         Process a YouTube video and return structured results.
 
+        The transcript is extracted once, then every missing style is sent to
+        the LLM at the same time from worker threads, so a request for several
+        styles takes about as long as its slowest style.
+
         Args:
             video_url: YouTube video URL
             styles: List of processing styles (if None, uses all available)
@@ -144,7 +531,7 @@ class VideoProcessingService:
             ExternalServiceError: If external service fails
             ProcessingTimeoutError: If processing times out
         """
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
         try:
             # If no styles specified, use all available styles
@@ -153,36 +540,39 @@ class VideoProcessingService:
 
             self._validate_styles(styles)
 
-            # Create temporary directory for output
-            with tempfile.TemporaryDirectory() as temp_dir:
-                # Process the video using GetOutVideo API
-                output_files = self.api.process_youtube_url(
-                    url=video_url,
-                    output_dir=temp_dir,
-                    styles=styles,
-                    output_language=output_language,
+            results, video_title, missing_styles = self._load_stored_results(
+                video_url,
+                styles,
+                output_language,
+            )
+
+            if missing_styles:
+                video_title = await self._process_styles(
+                    video_url,
+                    missing_styles,
+                    output_language,
+                    results,
+                    video_title,
                 )
 
-                results, video_title = self._parse_output_files(output_files)
-                processing_time = time.time() - start_time
-
-                return {
-                    "video_url": video_url,
-                    "video_title": video_title.replace("_", " "),
-                    "processed_at": datetime.now(UTC).isoformat(),
-                    "results": results,
-                    "metadata": {
-                        "processing_time": round(processing_time, 2),
-                        "language": output_language,
-                        "styles_processed": styles,
-                    },
-                }
-
-        except VideoValidationError:
-            raise
-        except (ExternalServiceError, ProcessingTimeoutError, ConfigurationError):
+            return self._build_result(
+                video_url,
+                video_title or "Unknown Title",
+                results,
+                output_language,
+                styles,
+                start_ns,
+            )
+
+        except _SERVICE_ERRORS:
             raise
         except Exception as e:  # noqa: BLE001
             # Broad exception handling is intentional here to catch and categorize
             # various external API errors that might not have specific types
             self._handle_processing_error(e, video_url)
+
+
+@functools.lru_cache(maxsize=1)
+def get_service() -> VideoProcessingService:
+    """Return the process-wide VideoProcessingService, built on first use."""
+    return VideoProcessingService()
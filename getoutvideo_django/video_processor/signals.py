@@ -1,5 +1,17 @@
 """
 Django signals for the video_processor app.
 """
-# Placeholder for future signal handlers
-# Import this file in apps.py ready() method
+
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+from .services import _get_config
+from .services import get_service
+
+
+@receiver(setting_changed)
+def reset_getoutvideo_config(*, setting, **kwargs):
+    """Drop the cached GetOutVideo configuration when the setting changes."""
+    if setting == "GETOUTVIDEO_CONFIG":
+        _get_config.cache_clear()
+        get_service.cache_clear()
@@ -0,0 +1,130 @@
+"""
+Celery tasks for video processing operations.
+"""
+
+import asyncio
+import logging
+
+from celery.exceptions import SoftTimeLimitExceeded
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework import serializers
+from rest_framework import status
+
+from config import celery_app
+
+from .exceptions import ProcessingTimeoutError
+from .exceptions import VideoProcessorError
+from .exceptions import VideoValidationError
+from .models import VideoProcessingJob
+from .responses import result_cache_key
+from .responses import success_payload
+from .services import get_service
+
+logger = logging.getLogger(__name__)
+
+# Errors caused by the request itself rather than by the service
+_CLIENT_ERRORS = (VideoValidationError, ProcessingTimeoutError)
+
+
+def _video_queue(video_url: str) -> str | None:
+    """
+    Pick the worker queue for a video by its duration.
+
+    Short videos get a queue of their own so they never wait behind long
+    ones; None leaves the choice to CELERY_TASK_ROUTES.
+    """
+    try:
+        duration = get_service().get_video_duration(video_url)
+    except VideoProcessorError as e:
+        logger.warning("Video duration lookup failed: %s", e.message)
+        return None
+    if duration is not None and duration <= settings.VIDEO_SHORT_MAX_DURATION:
+        return settings.VIDEO_SHORT_QUEUE
+    return None
+
+
+@celery_app.task()
+def route_video_task(job_pk: str) -> None:
+    """
+    Queue a job's processing task on the queue its video's duration picks.
+
+    The duration probe is a network call, so it runs here on a worker rather
+    than in the request that created the job.
+    """
+    job = VideoProcessingJob.objects.get(pk=job_pk)
+    process_video_task.apply_async(args=[job_pk], queue=_video_queue(job.video_url))
+
+
+@celery_app.task()
+def process_video_task(job_pk: str) -> None:
+    """
+    Process the video of a queued job on a worker.
+
+    Only the job's primary key travels through the broker; the processing
+    inputs are read from the job, and the result or the error response it
+    maps to is written back to it. Styles are processed concurrently through
+    the service's async pipeline. The success payload is validated and cached
+    here, once, so status polls only read it. Errors are re-raised so the
+    worker still reports the task as failed.
+    """
+    job = VideoProcessingJob.objects.get(pk=job_pk)
+    job.mark_processing()
+
+    logger.info("Starting video processing for URL: %s", job.video_url)
+    try:
+        result_data = asyncio.run(
+            get_service().aprocess_video(
+                video_url=job.video_url,
+                styles=job.styles,
+                output_language=job.output_language,
+            ),
+        )
+    except SoftTimeLimitExceeded:
+        logger.warning("Video processing job %s exceeded its time limit", job.pk)
+        error = ProcessingTimeoutError("Video processing timed out")
+        job.mark_failure(error.message, error.status_code)
+        raise
+    except _CLIENT_ERRORS as e:
+        logger.warning("Processing error: %s", e.message)
+        job.mark_failure(e.message, e.status_code)
+        raise
+    except VideoProcessorError as e:
+        # Expected failures, often repeated during an upstream outage, so the
+        # traceback is left out; only unexpected errors below log one
+        logger.error(  # noqa: TRY400
+            "Service error: %s",
+            e.message,
+            extra={"status_code": e.status_code},
+        )
+        job.mark_failure(e.message, e.status_code)
+        raise
+    except Exception:
+        logger.exception("Unexpected error during video processing")
+        job.mark_failure(
+            "An unexpected error occurred during video processing",
+            status.HTTP_500_INTERNAL_SERVER_ERROR,
+        )
+        raise
+
+    try:
+        payload = success_payload(result_data)
+    except serializers.ValidationError as e:
+        # An expected validation outcome, so no traceback is logged
+        logger.error("Response serialization failed: %s", e.detail)  # noqa: TRY400
+        job.mark_failure(
+            "Response formatting error",
+            status.HTTP_500_INTERNAL_SERVER_ERROR,
+        )
+        raise
+
+    cache.set(
+        result_cache_key(job.video_url, job.styles, job.output_language),
+        payload,
+        timeout=settings.VIDEO_RESULT_TTL,
+    )
+    job.mark_success(payload["data"])
+    logger.info(
+        "Video processing completed successfully for URL: %s",
+        job.video_url,
+    )
@@ -0,0 +1,104 @@
+"""
+Shared fixtures for video_processor tests.
+
+Session-scoped fixtures return reference data shared by every test; tests must
+copy them before making changes.
+"""
+
+from unittest.mock import Mock
+
+import pytest
+from django.core.cache import cache
+from django.urls import reverse
+from getoutvideo import GetOutVideoAPI
+
+from getoutvideo_django.users.tests.factories import UserFactory
+from getoutvideo_django.video_processor.services import _fetch_style_catalog
+
+# Spec'd so tests fail on calls the SDK does not provide
+_API_TEMPLATE = Mock(spec=GetOutVideoAPI)
+
+
+@pytest.fixture(autouse=True)
+def _clear_result_cache():
+    """Keep responses cached by one test from answering another."""
+    yield
+    cache.clear()
+
+
+@pytest.fixture(scope="session")
+def shared_user(django_db_setup, django_db_blocker):
+    """User created once per session for tests that only need a principal."""
+    with django_db_blocker.unblock():
+        user = UserFactory(username="testuser")
+    yield user
+    with django_db_blocker.unblock():
+        user.delete()
+
+
+@pytest.fixture(scope="session")
+def valid_video_url():
+    """Valid YouTube video URL for testing."""
+    return "https://www.youtube.com/watch?v=test123"
+
+
+@pytest.fixture(scope="session")
+def default_styles():
+    """Styles offered by the mocked GetOutVideo API."""
+    return ["Summary", "Educational", "Balanced and Detailed"]
+
+
+@pytest.fixture
+def mock_getoutvideo_api(monkeypatch):
+    """Mock GetOutVideoAPI instance returned by the SDK class, reset after use."""
+    monkeypatch.setattr(
+        "getoutvideo_django.video_processor.services.GetOutVideoAPI",
+        Mock(return_value=_API_TEMPLATE),
+    )
+    monkeypatch.setattr(
+        "getoutvideo_django.video_processor.services._api_clients",
+        {},
+    )
+    monkeypatch.setattr(
+        "getoutvideo_django.video_processor.services._openai_clients",
+        {},
+    )
+    # The style catalog is cached per client, and every test shares one mock
+    _fetch_style_catalog.cache_clear()
+    yield _API_TEMPLATE
+    _API_TEMPLATE.reset_mock(return_value=True, side_effect=True)
+
+
+@pytest.fixture(scope="session")
+def valid_request_data(valid_video_url):
+    """Valid request data for testing."""
+    return {
+        "video_url": valid_video_url,
+        "styles": ["Summary", "Educational"],
+        "output_language": "English",
+    }
+
+
+@pytest.fixture(scope="session")
+def mock_service_success_response(valid_video_url):
+    """Mock successful service response."""
+    return {
+        "video_url": valid_video_url,
+        "video_title": "Test Video",
+        "processed_at": "2024-01-01T12:00:00Z",
+        "results": {
+            "summary": "Test summary content",
+            "educational": "Test educational content",
+        },
+        "metadata": {
+            "processing_time": 25.5,
+            "language": "English",
+            "styles_processed": ["Summary", "Educational"],
+        },
+    }
+
+
+@pytest.fixture(scope="session")
+def process_url():
+    """Resolved path of the video processing endpoint."""
+    return reverse("video_processor:process-video")
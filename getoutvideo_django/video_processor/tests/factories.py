@@ -8,79 +8,84 @@ from typing import Any
 
 import factory
 from factory import Faker
+from factory.django import DjangoModelFactory
+from factory.random import randgen
+
+from getoutvideo_django.video_processor.models import VideoProcessingJob
+
+VALID_VIDEO_URLS = (
+    "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+    "https://youtube.com/watch?v=test123456",
+    "https://youtu.be/abcdef12345",
+    "https://www.youtube.com/embed/xyz987654",
+    "https://m.youtube.com/watch?v=mobile123",
+)
+STYLE_NAMES = (
+    "Summary",
+    "Educational",
+    "Balanced and Detailed",
+    "Narrative Rewriting",
+    "Q&A Generation",
+)
+OUTPUT_LANGUAGES = ("English", "Spanish", "French", "German", "Italian")
+INVALID_VIDEO_URLS = (
+    "not-a-url",
+    "http://example.com",
+    "https://vimeo.com/123456",
+    "ftp://invalid-protocol.com",
+    "",
+)
+INVALID_STYLE_LISTS: tuple[list[str], ...] = (
+    ["InvalidStyle"],
+    ["Summary", "NonExistentStyle"],
+    [""],
+    [],
+)
+ERROR_CODES = (400, 422, 500, 502)
+
+# Fixed filler text; sliced to the needed length instead of generating it
+LOREM_TEXT = (
+    "Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do eiusmod "
+    "tempor incididunt ut labore et dolore magna aliqua. Ut enim ad minim veniam, "
+    "quis nostrud exercitation ullamco laboris nisi ut aliquip ex ea commodo "
+    "consequat. "
+) * 4
 
 
 class VideoProcessRequestDataFactory(factory.DictFactory):
     """Factory for creating valid video process request data."""
 
-    video_url = Faker(
-        "random_element",
-        elements=[
-            "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
-            "https://youtube.com/watch?v=test123456",
-            "https://youtu.be/abcdef12345",
-            "https://www.youtube.com/embed/xyz987654",
-            "https://m.youtube.com/watch?v=mobile123",
-        ],
-    )
-    styles = factory.LazyAttribute(
-        lambda obj: factory.Faker(
-            "random_elements",
-            elements=[
-                "Summary",
-                "Educational",
-                "Balanced and Detailed",
-                "Narrative Rewriting",
-                "Q&A Generation",
-            ],
-            length=factory.Faker("random_int", min=1, max=3),
-            unique=True,
-        ).evaluate(None, None, extra={"locale": None}),
-    )
-    output_language = Faker(
-        "random_element",
-        elements=["English", "Spanish", "French", "German", "Italian"],
+    video_url = factory.LazyFunction(lambda: randgen.choice(VALID_VIDEO_URLS))
+    styles = factory.LazyFunction(
+        lambda: randgen.sample(STYLE_NAMES, randgen.randint(1, 3)),
     )
+    output_language = factory.LazyFunction(lambda: randgen.choice(OUTPUT_LANGUAGES))
 
 
 class VideoProcessResponseDataFactory(factory.DictFactory):
     """Factory for creating video process response data."""
 
-    video_url = factory.SubFactory(VideoProcessRequestDataFactory, "video_url")
+    video_url = factory.LazyFunction(lambda: randgen.choice(VALID_VIDEO_URLS))
     video_title = Faker("sentence", nb_words=4)
     processed_at = factory.LazyFunction(lambda: datetime.now(UTC).isoformat())
 
-    results = factory.LazyAttribute(
-        lambda obj: {
-            "summary": Faker("text", max_nb_chars=500).evaluate(
-                None,
-                None,
-                extra={"locale": None},
-            ),
-            "educational": Faker("text", max_nb_chars=600).evaluate(
-                None,
-                None,
-                extra={"locale": None},
-            ),
-            "balanced": Faker("text", max_nb_chars=550).evaluate(
-                None,
-                None,
-                extra={"locale": None},
-            ),
+    results = factory.Dict(
+        {
+            "summary": LOREM_TEXT[:500],
+            "educational": LOREM_TEXT[:600],
+            "balanced": LOREM_TEXT[:550],
         },
     )
 
-    metadata = factory.LazyAttribute(
-        lambda obj: {
-            "processing_time": factory.Faker(
-                "pyfloat",
-                left_digits=2,
-                right_digits=2,
-                positive=True,
-                max_value=120.0,
-            ).evaluate(None, None, extra={"locale": None}),
+    metadata = factory.Dict(
+        {
+            "processing_time": factory.LazyFunction(
+                lambda: round(randgen.uniform(0.01, 99.99), 2),
+            ),
             "language": "English",
-            "styles_processed": ["Summary", "Educational", "Balanced and Detailed"],
+            "styles_processed": factory.List(
+                ["Summary", "Educational", "Balanced and Detailed"],
+            ),
         },
     )
 
@@ -94,25 +99,8 @@ class MinimalVideoProcessRequestDataFactory(factory.DictFactory):
 class InvalidVideoProcessRequestDataFactory(factory.DictFactory):
     """Factory for creating invalid request data for testing validation."""
 
-    video_url = Faker(
-        "random_element",
-        elements=[
-            "not-a-url",
-            "http://example.com",
-            "https://vimeo.com/123456",
-            "ftp://invalid-protocol.com",
-            "",
-        ],
-    )
-    styles = Faker(
-        "random_element",
-        elements=[
-            ["InvalidStyle"],
-            ["Summary", "NonExistentStyle"],
-            [""],
-            [],
-        ],
-    )
+    video_url = factory.LazyFunction(lambda: randgen.choice(INVALID_VIDEO_URLS))
+    styles = factory.LazyFunction(lambda: list(randgen.choice(INVALID_STYLE_LISTS)))
 
 
 class MockGetOutVideoAPIResponseFactory:
@@ -178,7 +166,7 @@ class ErrorResponseDataFactory(factory.DictFactory):
 
     status = "error"
     error = Faker("sentence", nb_words=6)
-    code = Faker("random_element", elements=[400, 422, 500, 502])
+    code = factory.LazyFunction(lambda: randgen.choice(ERROR_CODES))
 
 
 class ThrottleConfigFactory:
@@ -263,3 +251,16 @@ class APITestDataFactory:
                 "expected_status": 502,
             },
         ]
+
+
+class VideoProcessingJobFactory(DjangoModelFactory[VideoProcessingJob]):
+    """Factory for creating queued video processing jobs."""
+
+    video_url = factory.LazyFunction(lambda: randgen.choice(VALID_VIDEO_URLS))
+    styles = factory.LazyFunction(
+        lambda: randgen.sample(STYLE_NAMES, randgen.randint(1, 3)),
+    )
+    output_language = "English"
+
+    class Meta:
+        model = VideoProcessingJob
@@ -0,0 +1,49 @@
+"""
+Tests for video processor exceptions and the custom exception handler.
+"""
+
+from http import HTTPStatus
+
+from rest_framework.exceptions import NotFound
+
+from getoutvideo_django.video_processor.exceptions import ExternalServiceError
+from getoutvideo_django.video_processor.exceptions import VideoProcessorError
+from getoutvideo_django.video_processor.exceptions import custom_exception_handler
+
+
+class TestCustomExceptionHandler:
+    """Test custom_exception_handler behaviour."""
+
+    def test_custom_exception_response(self):
+        """Test that video processor errors are rendered with their status code."""
+        response = custom_exception_handler(
+            ExternalServiceError("Upstream failed"),
+            {},
+        )
+
+        assert response.status_code == HTTPStatus.BAD_GATEWAY
+        assert response.data == {
+            "error": "Upstream failed",
+            "status_code": HTTPStatus.BAD_GATEWAY,
+        }
+
+    def test_custom_exception_subclass(self):
+        """Test that subclasses of the base error are handled too."""
+
+        class CustomError(VideoProcessorError):
+            pass
+
+        response = custom_exception_handler(CustomError("Custom failure"), {})
+
+        assert response.status_code == HTTPStatus.INTERNAL_SERVER_ERROR
+        assert response.data["error"] == "Custom failure"
+
+    def test_other_exceptions_use_default_handler(self):
+        """Test that non video processor exceptions fall through to DRF."""
+        response = custom_exception_handler(NotFound(), {})
+
+        assert response.status_code == HTTPStatus.NOT_FOUND
+
+    def test_unhandled_exception_returns_none(self):
+        """Test that unknown exceptions are left for Django to handle."""
+        assert custom_exception_handler(ValueError("boom"), {}) is None
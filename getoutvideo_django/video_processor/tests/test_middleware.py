@@ -0,0 +1,129 @@
+"""
+Tests for video_processor middleware.
+"""
+
+import time
+from http import HTTPStatus
+from unittest.mock import Mock
+
+import pytest
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.test import RequestFactory
+from django.utils.http import http_date
+
+from getoutvideo_django.video_processor.middleware import ThrottleBlacklistMiddleware
+
+PROCESS_PATH = "/api/v1/video/process/"
+PROXY_ADDR = "10.0.0.1"
+
+
+def _session_request(session_key):
+    """POST from a session client, arriving through the reverse proxy."""
+    request = RequestFactory().post(PROCESS_PATH, REMOTE_ADDR=PROXY_ADDR)
+    request.COOKIES[settings.SESSION_COOKIE_NAME] = session_key
+    return request
+
+
+class TestThrottleBlacklistMiddleware:
+    """Test ThrottleBlacklistMiddleware functionality."""
+
+    @pytest.fixture(autouse=True)
+    def _clear_blacklist(self):
+        """Keep clients blacklisted by one test from affecting another."""
+        yield
+        cache.clear()
+
+    @pytest.fixture
+    def throttled_response(self):
+        """DRF-style throttled response asking the client to wait a minute."""
+        response = HttpResponse(status=HTTPStatus.TOO_MANY_REQUESTS)
+        response["Retry-After"] = "60"
+        return response
+
+    def test_throttled_client_is_rejected_before_the_view(self, throttled_response):
+        """Test that a client throttled by a view is rejected without calling it."""
+        get_response = Mock(return_value=throttled_response)
+        middleware = ThrottleBlacklistMiddleware(get_response)
+        request_factory = RequestFactory()
+
+        middleware(request_factory.post("/api/v1/video/process/"))
+        response = middleware(request_factory.post("/api/v1/video/process/"))
+
+        assert response.status_code == HTTPStatus.TOO_MANY_REQUESTS
+        assert 0 < int(response["Retry-After"]) <= 60  # noqa: PLR2004
+        get_response.assert_called_once()
+
+    def test_blacklist_is_per_client_and_path(self, throttled_response):
+        """Test that other clients and other paths are still served."""
+        get_response = Mock(return_value=throttled_response)
+        middleware = ThrottleBlacklistMiddleware(get_response)
+        request_factory = RequestFactory()
+        middleware(request_factory.post("/api/v1/video/process/"))
+
+        get_response.return_value = HttpResponse()
+        other_client = middleware(
+            request_factory.post(
+                "/api/v1/video/process/",
+                HTTP_AUTHORIZATION="Token other",
+            ),
+        )
+        other_path = middleware(request_factory.get("/api/v1/video/jobs/"))
+
+        assert other_client.status_code == HTTPStatus.OK
+        assert other_path.status_code == HTTPStatus.OK
+
+    def test_session_users_behind_one_proxy_are_separate(self, throttled_response):
+        """Test that throttling one session user does not block another."""
+        get_response = Mock(return_value=throttled_response)
+        middleware = ThrottleBlacklistMiddleware(get_response)
+        middleware(_session_request("first-session"))
+
+        get_response.return_value = HttpResponse()
+        other_user = middleware(_session_request("second-session"))
+        throttled_user = middleware(_session_request("first-session"))
+
+        assert other_user.status_code == HTTPStatus.OK
+        assert throttled_user.status_code == HTTPStatus.TOO_MANY_REQUESTS
+
+    def test_anonymous_clients_are_told_apart_by_forwarded_address(
+        self,
+        throttled_response,
+    ):
+        """Test that clients behind the proxy are keyed by X-Forwarded-For."""
+        get_response = Mock(return_value=throttled_response)
+        middleware = ThrottleBlacklistMiddleware(get_response)
+        request_factory = RequestFactory()
+        middleware(
+            request_factory.post(
+                PROCESS_PATH,
+                REMOTE_ADDR=PROXY_ADDR,
+                HTTP_X_FORWARDED_FOR="203.0.113.1",
+            ),
+        )
+
+        get_response.return_value = HttpResponse()
+        response = middleware(
+            request_factory.post(
+                PROCESS_PATH,
+                REMOTE_ADDR=PROXY_ADDR,
+                HTTP_X_FORWARDED_FOR="203.0.113.2",
+            ),
+        )
+
+        assert response.status_code == HTTPStatus.OK
+
+    def test_retry_after_http_date(self):
+        """Test that a Retry-After date blacklists the client until then."""
+        throttled_response = HttpResponse(status=HTTPStatus.TOO_MANY_REQUESTS)
+        throttled_response["Retry-After"] = http_date(time.time() + 60)
+        get_response = Mock(return_value=throttled_response)
+        middleware = ThrottleBlacklistMiddleware(get_response)
+        request_factory = RequestFactory()
+
+        middleware(request_factory.post(PROCESS_PATH))
+        response = middleware(request_factory.post(PROCESS_PATH))
+
+        assert response.status_code == HTTPStatus.TOO_MANY_REQUESTS
+        get_response.assert_called_once()
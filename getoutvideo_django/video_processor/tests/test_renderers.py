@@ -0,0 +1,47 @@
+"""
+Tests for video processor response renderers.
+"""
+
+import json
+from datetime import UTC
+from datetime import datetime
+from decimal import Decimal
+
+from django.utils.translation import gettext_lazy
+
+from getoutvideo_django.video_processor.renderers import ORJSONRenderer
+
+
+class TestORJSONRenderer:
+    """Test ORJSONRenderer output."""
+
+    def test_render_matches_json(self):
+        """Test that rendered bytes decode to the original data."""
+        data = {
+            "status": "success",
+            "data": {"results": {"summary": "Résumé content"}, "count": 2},
+        }
+
+        rendered = ORJSONRenderer().render(data)
+
+        assert json.loads(rendered) == data
+
+    def test_render_utc_datetime_with_z_suffix(self):
+        """Test that UTC datetimes are rendered with a Z suffix."""
+        rendered = ORJSONRenderer().render(
+            {"processed_at": datetime(2024, 1, 1, 12, 0, tzinfo=UTC)},
+        )
+
+        assert json.loads(rendered) == {"processed_at": "2024-01-01T12:00:00Z"}
+
+    def test_render_falls_back_to_drf_encoder(self):
+        """Test that types orjson cannot encode use DRF's encoder."""
+        rendered = ORJSONRenderer().render(
+            {"label": gettext_lazy("Video Processor"), "value": Decimal("1.5")},
+        )
+
+        assert json.loads(rendered) == {"label": "Video Processor", "value": 1.5}
+
+    def test_render_none(self):
+        """Test that None renders an empty body."""
+        assert ORJSONRenderer().render(None) == b""
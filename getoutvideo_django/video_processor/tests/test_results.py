@@ -0,0 +1,33 @@
+"""
+Tests for the processed video result store.
+"""
+
+from getoutvideo_django.video_processor.results import StyleResultStore
+
+
+class TestStyleResultStore:
+    """Test StyleResultStore functionality."""
+
+    def test_saved_results_are_loaded(self, tmp_path, valid_video_url):
+        """Test that stored results and title are read back."""
+        store = StyleResultStore(str(tmp_path))
+        store.save(valid_video_url, "English", "TestVideo", {"summary": "content"})
+
+        results, title = store.load(valid_video_url, "English", ["summary", "qa"])
+
+        assert results == {"summary": "content"}
+        assert title == "TestVideo"
+
+    def test_entries_are_keyed_by_language(self, tmp_path, valid_video_url):
+        """Test that a result stored for one language is not used for another."""
+        store = StyleResultStore(str(tmp_path))
+        store.save(valid_video_url, "English", "TestVideo", {"summary": "content"})
+
+        assert store.load(valid_video_url, "German", ["summary"]) == ({}, None)
+
+    def test_save_leaves_no_temporary_files(self, tmp_path, valid_video_url):
+        """Test that atomic writes clean up after themselves."""
+        store = StyleResultStore(str(tmp_path))
+        store.save(valid_video_url, "English", "TestVideo", {"summary": "content"})
+
+        assert not list(tmp_path.rglob("*.tmp"))
@@ -0,0 +1,86 @@
+"""
+Tests for the scratch directory pool.
+"""
+
+import fcntl
+import gc
+import os
+from pathlib import Path
+
+from getoutvideo_django.video_processor.scratch import ScratchDirectoryPool
+
+
+class TestScratchDirectoryPool:
+    """Test ScratchDirectoryPool functionality."""
+
+    def test_slot_is_emptied_and_reused(self, tmp_path):
+        """Test that a released slot is cleared and handed out again."""
+        pool = ScratchDirectoryPool(str(tmp_path), size=1)
+
+        with pool.acquire() as first_dir:
+            (Path(first_dir) / "TestVideo_Summary.md").write_text("content")
+            (Path(first_dir) / "nested").mkdir()
+
+        with pool.acquire() as second_dir:
+            assert second_dir == first_dir
+            assert not any(Path(second_dir).iterdir())
+
+    def test_concurrent_acquires_get_distinct_slots(self, tmp_path):
+        """Test that slots held at the same time are different directories."""
+        pool = ScratchDirectoryPool(str(tmp_path), size=2)
+
+        with pool.acquire() as first_dir, pool.acquire() as second_dir:
+            assert first_dir != second_dir
+
+    def test_exhausted_pool_falls_back_to_temporary_directory(self, tmp_path):
+        """Test that a temporary directory is used when every slot is taken."""
+        pool = ScratchDirectoryPool(str(tmp_path), size=1)
+
+        with pool.acquire() as slot_dir, pool.acquire() as fallback_dir:
+            assert not fallback_dir.startswith(str(tmp_path))
+            assert Path(fallback_dir).is_dir()
+
+        assert not Path(fallback_dir).exists()
+        assert Path(slot_dir).is_dir()
+
+    def test_pool_directory_removed_with_pool(self, tmp_path):
+        """Test that a pool's directory does not outlive the pool."""
+        pool = ScratchDirectoryPool(str(tmp_path), size=2)
+        assert any(tmp_path.iterdir())
+
+        del pool
+        gc.collect()
+
+        assert not any(tmp_path.iterdir())
+
+    def test_stale_pools_removed_on_start(self, tmp_path):
+        """Test that pools no process holds the lock on are removed."""
+        stale_pool = tmp_path / "pool-abc"
+        (stale_pool / "slot-0").mkdir(parents=True)
+
+        ScratchDirectoryPool(str(tmp_path), size=1)
+
+        assert not stale_pool.exists()
+
+    def test_locked_pools_kept_on_start(self, tmp_path):
+        """Test that pools whose lock is held elsewhere are left alone."""
+        live_pool = tmp_path / "pool-abc"
+        live_pool.mkdir()
+        # Stands in for a process, possibly in another container, using it
+        fd = os.open(live_pool, os.O_RDONLY)
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        try:
+            ScratchDirectoryPool(str(tmp_path), size=1)
+        finally:
+            os.close(fd)
+
+        assert live_pool.exists()
+
+    def test_pools_in_one_root_kept_while_in_use(self, tmp_path):
+        """Test that starting a pool does not remove another live pool."""
+        first = ScratchDirectoryPool(str(tmp_path), size=1)
+        second = ScratchDirectoryPool(str(tmp_path), size=1)
+
+        with first.acquire() as first_dir, second.acquire() as second_dir:
+            assert Path(first_dir).is_dir()
+            assert Path(second_dir).is_dir()
@@ -2,243 +2,514 @@
 Tests for video processing services.
 """
 
-import tempfile
-from pathlib import Path
+import asyncio
+import contextlib
+import threading
+from unittest.mock import MagicMock
 from unittest.mock import Mock
-from unittest.mock import patch
 
 import pytest
+import yt_dlp
+from getoutvideo import AIProcessor
+from getoutvideo import APIConfig
 
 from getoutvideo_django.video_processor.exceptions import ConfigurationError
 from getoutvideo_django.video_processor.exceptions import ExternalServiceError
 from getoutvideo_django.video_processor.exceptions import ProcessingTimeoutError
 from getoutvideo_django.video_processor.exceptions import VideoValidationError
 from getoutvideo_django.video_processor.services import VideoProcessingService
+from getoutvideo_django.video_processor.services import _PooledAIProcessor
+from getoutvideo_django.video_processor.services import _split_output_stem
+
+
+@pytest.fixture(scope="module")
+def default_style_files(tmp_path_factory, default_styles):
+    """SDK output files for every default style, written once per module."""
+    output_dir = tmp_path_factory.mktemp("styles")
+    files = []
+    for style in default_styles:
+        test_file = output_dir / f"TestVideo_{style.replace(' ', '_')}.md"
+        test_file.write_text(f"{style} content", encoding="utf-8")
+        files.append(str(test_file))
+    return files
 
 
 class TestVideoProcessingService:
     """Test VideoProcessingService functionality."""
 
     @pytest.fixture
-    def service(self):
+    def service(self, settings, mock_getoutvideo_api):
         """Create a VideoProcessingService instance for testing."""
+        settings.GETOUTVIDEO_CONFIG = {"OPENAI_API_KEY": "test-api-key"}
         return VideoProcessingService()
 
-    @pytest.fixture
-    def mock_api(self):
-        """Create a mock GetOutVideoAPI instance."""
-        return Mock()
-
-    @patch("getoutvideo_django.video_processor.services.GetOutVideoAPI")
-    def test_init_with_valid_config(self, mock_getoutvideo_class, service):
+    def test_init_with_valid_config(self, service, mock_getoutvideo_api):
         """Test initialization with valid configuration."""
-        mock_instance = Mock()
-        mock_getoutvideo_class.return_value = mock_instance
-
-        # Re-initialize service to trigger API creation
-        new_service = VideoProcessingService()
-        assert new_service.api is not None
+        assert service.api is mock_getoutvideo_api
 
-    @patch("getoutvideo_django.video_processor.services.GetOutVideoAPI")
-    @patch("django.conf.settings")
-    def test_init_missing_config(self, mock_settings, mock_getoutvideo_class):
+    def test_init_missing_config(self, settings):
         """Test initialization with missing configuration."""
-        mock_settings.GETOUTVIDEO_CONFIG = {}
+        settings.GETOUTVIDEO_CONFIG = {}
 
         with pytest.raises(
             ConfigurationError,
-            match="GetOutVideo configuration is missing API key",
+            match="OPENAI_API_KEY not configured",
         ):
             VideoProcessingService()
 
-    @patch("getoutvideo_django.video_processor.services.GetOutVideoAPI")
-    def test_process_video_success(self, mock_getoutvideo_class, service):
-        """Test successful video processing."""
-        mock_api = Mock()
-        mock_getoutvideo_class.return_value = mock_api
-        mock_api.get_available_styles.return_value = ["Summary"]
-
-        # Create test files in a temporary directory
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            test_file = temp_path / "TestVideo_Summary.md"
-            test_file.write_text("Test summary content", encoding="utf-8")
+    @pytest.fixture
+    def ai_processor(self, monkeypatch, mock_getoutvideo_api):
+        """
+        Stand-in for the SDK's AI processor class.
+
+        Processors return the files listed under their style in the fixture's
+        outputs dict, and the transcript of a video titled "TestVideo" is
+        extracted.
+        """
+        mock_getoutvideo_api.extract_transcripts.return_value = [
+            Mock(title="TestVideo"),
+        ]
 
-            mock_api.process.return_value = [str(test_file)]
+        def build_processor(config, client):
+            (style,) = config.processing_config.styles
+            processor = Mock()
+            processor.process_transcripts.return_value = [
+                Mock(output_file_path=path)
+                for path in ai_processor_class.outputs.get(style, [])
+            ]
+            return processor
+
+        ai_processor_class = Mock(side_effect=build_processor)
+        ai_processor_class.outputs = {}
+        monkeypatch.setattr(
+            "getoutvideo_django.video_processor.services._PooledAIProcessor",
+            ai_processor_class,
+        )
+        return ai_processor_class
+
+    def test_process_video_success(
+        self,
+        service,
+        mock_getoutvideo_api,
+        ai_processor,
+        tmp_path,
+        valid_video_url,
+    ):
+        """Test successful video processing."""
+        mock_getoutvideo_api.get_available_styles.return_value = ["Summary"]
 
-            # Re-initialize service with mocked API
-            service.api = mock_api
+        test_file = tmp_path / "TestVideo_Summary.md"
+        test_file.write_text("Test summary content", encoding="utf-8")
+        ai_processor.outputs["Summary"] = [str(test_file)]
 
-            result = service.process_video(
-                video_url="https://youtube.com/watch?v=test123",
+        result = asyncio.run(
+            service.aprocess_video(
+                video_url=valid_video_url,
                 styles=["Summary"],
                 output_language="English",
-            )
+            ),
+        )
 
-            assert result["video_url"] == "https://youtube.com/watch?v=test123"
-            assert result["video_title"] == "TestVideo"
-            assert "processed_at" in result
-            assert result["results"]["summary"] == "Test summary content"
-            assert result["metadata"]["language"] == "English"
-            assert result["metadata"]["styles_processed"] == ["Summary"]
+        assert result["video_url"] == valid_video_url
+        assert result["video_title"] == "TestVideo"
+        assert "processed_at" in result
+        assert result["results"]["summary"] == "Test summary content"
+        assert result["metadata"]["language"] == "English"
+        assert result["metadata"]["styles_processed"] == ["Summary"]
 
-    @patch("getoutvideo_django.video_processor.services.GetOutVideoAPI")
-    def test_process_video_invalid_styles(self, mock_getoutvideo_class, service):
+    def test_process_video_invalid_styles(
+        self,
+        service,
+        mock_getoutvideo_api,
+        valid_video_url,
+    ):
         """Test processing with invalid styles."""
-        mock_api = Mock()
-        mock_getoutvideo_class.return_value = mock_api
-        mock_api.get_available_styles.return_value = ["Summary", "Educational"]
-
-        service.api = mock_api
+        mock_getoutvideo_api.get_available_styles.return_value = [
+            "Summary",
+            "Educational",
+        ]
 
         with pytest.raises(
             VideoValidationError,
             match="Invalid styles: \\['InvalidStyle'\\]. Available styles:",
         ):
-            service.process_video(
-                video_url="https://youtube.com/watch?v=test123",
-                styles=["InvalidStyle"],
+            asyncio.run(
+                service.aprocess_video(
+                    video_url=valid_video_url,
+                    styles=["InvalidStyle"],
+                ),
             )
 
-    @patch("getoutvideo_django.video_processor.services.GetOutVideoAPI")
-    def test_process_video_api_error(self, mock_getoutvideo_class, service):
-        """Test processing with API errors."""
-        mock_api = Mock()
-        mock_getoutvideo_class.return_value = mock_api
-        mock_api.get_available_styles.return_value = ["Summary"]
-        mock_api.process.side_effect = Exception("API Error")
-
-        service.api = mock_api
-
-        with pytest.raises(ExternalServiceError, match="External service error"):
-            service.process_video(
-                video_url="https://youtube.com/watch?v=test123",
-                styles=["Summary"],
+    @pytest.mark.parametrize(
+        ("sdk_message", "expected_error", "expected_match"),
+        [
+            ("API Error", ExternalServiceError, "External service error"),
+            ("Timeout occurred", ProcessingTimeoutError, "Video processing timed out"),
+            (
+                "Authentication failed: 401 Unauthorized",
+                ConfigurationError,
+                "API authentication failed",
+            ),
+            (
+                "Invalid URL provided",
+                VideoValidationError,
+                "Invalid or inaccessible video URL",
+            ),
+            (
+                "Timeout while fetching: video unavailable",
+                VideoValidationError,
+                "Invalid or inaccessible video URL",
+            ),
+        ],
+    )
+    def test_process_video_sdk_error(  # noqa: PLR0913
+        self,
+        service,
+        mock_getoutvideo_api,
+        sdk_message,
+        expected_error,
+        expected_match,
+        valid_video_url,
+    ):
+        """Test mapping of SDK errors to service exceptions."""
+        mock_getoutvideo_api.get_available_styles.return_value = ["Summary"]
+        mock_getoutvideo_api.extract_transcripts.side_effect = Exception(sdk_message)
+
+        with pytest.raises(expected_error, match=expected_match):
+            asyncio.run(
+                service.aprocess_video(
+                    video_url=valid_video_url,
+                    styles=["Summary"],
+                ),
             )
 
-    @patch("getoutvideo_django.video_processor.services.GetOutVideoAPI")
-    def test_process_video_timeout_error(self, mock_getoutvideo_class, service):
-        """Test processing with timeout errors."""
-        mock_api = Mock()
-        mock_getoutvideo_class.return_value = mock_api
-        mock_api.get_available_styles.return_value = ["Summary"]
-        mock_api.process.side_effect = Exception("Timeout occurred")
+    def test_process_video_with_temp_directory_success(  # noqa: PLR0913
+        self,
+        service,
+        mock_getoutvideo_api,
+        ai_processor,
+        monkeypatch,
+        tmp_path,
+        valid_video_url,
+    ):
+        """Test video processing uses temporary directory correctly."""
+        mock_getoutvideo_api.get_available_styles.return_value = ["Summary"]
 
-        service.api = mock_api
+        temp_dirs = []
 
-        with pytest.raises(ProcessingTimeoutError, match="Video processing timed out"):
-            service.process_video(
-                video_url="https://youtube.com/watch?v=test123",
-                styles=["Summary"],
-            )
+        @contextlib.contextmanager
+        def fake_temporary_directory():
+            temp_dirs.append(tmp_path)
+            yield str(tmp_path)
 
-    @patch("getoutvideo_django.video_processor.services.GetOutVideoAPI")
-    def test_process_video_authentication_error(self, mock_getoutvideo_class, service):
-        """Test processing with authentication errors."""
-        mock_api = Mock()
-        mock_getoutvideo_class.return_value = mock_api
-        mock_api.get_available_styles.return_value = ["Summary"]
-        mock_api.process.side_effect = Exception("401 Unauthorized")
+        monkeypatch.setattr(
+            "getoutvideo_django.video_processor.services.tempfile.TemporaryDirectory",
+            fake_temporary_directory,
+        )
 
-        service.api = mock_api
+        # Create test file in the directory
+        test_file = tmp_path / "TestVideo_Summary.md"
+        test_file.write_text("Test content", encoding="utf-8")
+        ai_processor.outputs["Summary"] = [str(test_file)]
 
-        with pytest.raises(ConfigurationError, match="API authentication failed"):
-            service.process_video(
-                video_url="https://youtube.com/watch?v=test123",
+        result = asyncio.run(
+            service.aprocess_video(
+                video_url=valid_video_url,
                 styles=["Summary"],
-            )
-
-    @patch("getoutvideo_django.video_processor.services.GetOutVideoAPI")
-    def test_process_video_invalid_url_error(self, mock_getoutvideo_class, service):
-        """Test processing with invalid URL errors."""
-        mock_api = Mock()
-        mock_getoutvideo_class.return_value = mock_api
-        mock_api.get_available_styles.return_value = ["Summary"]
-        mock_api.process.side_effect = Exception("Invalid URL provided")
+            ),
+        )
 
-        service.api = mock_api
+        # Verify temporary directory was used
+        assert temp_dirs == [tmp_path]
+        (processor_call,) = ai_processor.call_args_list
+        assert processor_call.args[0].processing_config.styles == ["Summary"]
+        assert result["video_title"] == "TestVideo"
+        assert result["results"]["summary"] == "Test content"
 
-        with pytest.raises(
-            VideoValidationError,
-            match="Invalid or inaccessible video URL",
-        ):
-            service.process_video(
-                video_url="https://youtube.com/watch?v=invalid",
-                styles=["Summary"],
-            )
-
-    @patch("getoutvideo_django.video_processor.services.GetOutVideoAPI")
-    @patch("getoutvideo_django.video_processor.services.tempfile.TemporaryDirectory")
-    def test_process_video_with_temp_directory_success(
+    def test_process_video_default_parameters(  # noqa: PLR0913
         self,
-        mock_temp_dir,
-        mock_getoutvideo_class,
         service,
+        mock_getoutvideo_api,
+        ai_processor,
+        valid_video_url,
+        default_styles,
+        default_style_files,
     ):
-        """Test video processing uses temporary directory correctly."""
-        # Setup mocks
-        mock_api = Mock()
-        mock_getoutvideo_class.return_value = mock_api
-        mock_api.get_available_styles.return_value = ["Summary"]
-
-        # Create a real temporary directory for this test
-        with tempfile.TemporaryDirectory() as real_temp_dir:
-            mock_temp_dir_instance = Mock()
-            mock_temp_dir_instance.__enter__.return_value = real_temp_dir
-            mock_temp_dir_instance.__exit__.return_value = None
-            mock_temp_dir.return_value = mock_temp_dir_instance
-
-            # Create test file in the directory
-            temp_path = Path(real_temp_dir)
-            test_file = temp_path / "TestVideo_Summary.md"
-            test_file.write_text("Test content", encoding="utf-8")
-
-            mock_api.process.return_value = [str(test_file)]
-            service.api = mock_api
-
-            result = service.process_video(
-                video_url="https://youtube.com/watch?v=test123",
-                styles=["Summary"],
+        """Test processing with default parameters."""
+        mock_getoutvideo_api.get_available_styles.return_value = default_styles
+        for style, path in zip(default_styles, default_style_files, strict=True):
+            ai_processor.outputs[style] = [path]
+
+        # Call without styles parameter to test default behavior
+        result = asyncio.run(service.aprocess_video(video_url=valid_video_url))
+
+        # Verify all default styles were processed
+        expected_result_count = 3
+        assert len(result["results"]) == expected_result_count
+        assert "summary" in result["results"]
+        assert "educational" in result["results"]
+        assert "balanced" in result["results"]
+        assert result["metadata"]["language"] == "English"  # Default language
+
+    def test_concurrent_requests_keep_their_languages(
+        self,
+        service,
+        mock_getoutvideo_api,
+        ai_processor,
+        valid_video_url,
+    ):
+        """Test that concurrent requests never see each other's settings."""
+        mock_getoutvideo_api.get_available_styles.return_value = ["Summary"]
+
+        async def process_in_both_languages():
+            await asyncio.gather(
+                service.aprocess_video(valid_video_url, ["Summary"], "English"),
+                service.aprocess_video(valid_video_url, ["Summary"], "Spanish"),
             )
 
-            # Verify temporary directory was used
-            mock_temp_dir.assert_called_once()
-            assert result["video_title"] == "TestVideo"
-            assert result["results"]["summary"] == "Test content"
+        asyncio.run(process_in_both_languages())
 
-    @patch("getoutvideo_django.video_processor.services.GetOutVideoAPI")
-    def test_process_video_default_parameters(self, mock_getoutvideo_class, service):
-        """Test processing with default parameters."""
-        mock_api = Mock()
-        mock_getoutvideo_class.return_value = mock_api
-        mock_api.get_available_styles.return_value = [
+        languages = sorted(
+            call.args[0].processing_config.output_language
+            for call in ai_processor.call_args_list
+        )
+        assert languages == ["English", "Spanish"]
+        # The shared client's configuration is never written to
+        mock_getoutvideo_api.process_youtube_url.assert_not_called()
+        mock_getoutvideo_api.process_with_ai.assert_not_called()
+
+    def test_process_video_skips_stored_styles(  # noqa: PLR0913
+        self,
+        service,
+        settings,
+        mock_getoutvideo_api,
+        ai_processor,
+        tmp_path,
+        valid_video_url,
+    ):
+        """Test that only styles missing from the result store are processed."""
+        settings.GETOUTVIDEO_CONFIG = {
+            "OPENAI_API_KEY": "test-api-key",
+            "RESULT_DIR": str(tmp_path / "results"),
+        }
+        mock_getoutvideo_api.get_available_styles.return_value = [
             "Summary",
             "Educational",
-            "Balanced and Detailed",
         ]
+        summary_file = tmp_path / "TestVideo_Summary.md"
+        summary_file.write_text("Summary content", encoding="utf-8")
+        educational_file = tmp_path / "TestVideo_Educational.md"
+        educational_file.write_text("Educational content", encoding="utf-8")
+        ai_processor.outputs = {
+            "Summary": [str(summary_file)],
+            "Educational": [str(educational_file)],
+        }
+        asyncio.run(
+            service.aprocess_video(video_url=valid_video_url, styles=["Summary"]),
+        )
+        ai_processor.reset_mock()
+
+        result = asyncio.run(
+            service.aprocess_video(
+                video_url=valid_video_url,
+                styles=["Summary", "Educational"],
+            ),
+        )
+
+        (processor_call,) = ai_processor.call_args_list
+        assert processor_call.args[0].processing_config.styles == ["Educational"]
+        assert result["video_title"] == "TestVideo"
+        assert result["results"] == {
+            "summary": "Summary content",
+            "educational": "Educational content",
+        }
+        assert (
+            service.find_stored_result(
+                video_url=valid_video_url,
+                styles=["Educational", "Summary"],
+            )["results"]
+            == result["results"]
+        )
+        assert (
+            service.find_stored_result(
+                video_url=valid_video_url,
+                styles=["Summary", "Narrative Rewriting"],
+            )
+            is None
+        )
+
+    @pytest.mark.parametrize(
+        ("info", "expected"),
+        [({"duration": 212}, 212), ({}, None), (None, None)],
+    )
+    def test_get_video_duration(
+        self,
+        service,
+        monkeypatch,
+        valid_video_url,
+        info,
+        expected,
+    ):
+        """Test reading the duration from the video's metadata."""
+        mock_ydl = MagicMock()
+        mock_ydl.return_value.__enter__.return_value.extract_info.return_value = info
+        monkeypatch.setattr(
+            "getoutvideo_django.video_processor.services.yt_dlp.YoutubeDL",
+            mock_ydl,
+        )
+
+        assert service.get_video_duration(valid_video_url) == expected
+
+    @pytest.mark.parametrize(
+        "error",
+        [yt_dlp.utils.DownloadError("Video unavailable"), TimeoutError("timed out")],
+    )
+    def test_get_video_duration_unreadable(
+        self,
+        service,
+        monkeypatch,
+        valid_video_url,
+        error,
+    ):
+        """Test that videos whose metadata cannot be read have no duration."""
+        mock_ydl = MagicMock()
+        mock_ydl.return_value.__enter__.return_value.extract_info.side_effect = error
+        monkeypatch.setattr(
+            "getoutvideo_django.video_processor.services.yt_dlp.YoutubeDL",
+            mock_ydl,
+        )
 
-        # Create test files for all default styles
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            files = []
-            for style in ["Summary", "Educational", "Balanced_and_Detailed"]:
-                test_file = temp_path / f"TestVideo_{style}.md"
-                test_file.write_text(f"{style} content", encoding="utf-8")
-                files.append(str(test_file))
+        assert service.get_video_duration(valid_video_url) is None
 
-            mock_api.process.return_value = files
-            service.api = mock_api
+    def test_find_stored_result_without_store(self, service, valid_video_url):
+        """Test that nothing is found when results are not kept."""
+        assert service.find_stored_result(video_url=valid_video_url) is None
 
-            # Call without styles parameter to test default behavior
-            result = service.process_video(
-                video_url="https://youtube.com/watch?v=test123",
-            )
-
-            # Verify all default styles were processed
-            expected_result_count = 3
-            assert len(result["results"]) == expected_result_count
-            assert "summary" in result["results"]
-            assert "educational" in result["results"]
-            assert "balanced" in result["results"]
-            assert result["metadata"]["language"] == "English"  # Default language
+    def test_aprocess_video_stylizes_concurrently(  # noqa: PLR0913
+        self,
+        service,
+        mock_getoutvideo_api,
+        monkeypatch,
+        valid_video_url,
+        default_styles,
+        default_style_files,
+    ):
+        """Test that the transcript is extracted once and styles run in parallel."""
+        mock_getoutvideo_api.get_available_styles.return_value = default_styles
+        transcripts = [Mock(title="TestVideo")]
+        mock_getoutvideo_api.extract_transcripts.return_value = transcripts
+        output_files = dict(zip(default_styles, default_style_files, strict=True))
+        # Every style waits for the others, so this only passes when they overlap
+        barrier = threading.Barrier(len(default_styles), timeout=5)
+        processors = []
+
+        def fake_ai_processor(config, client):
+            (style,) = config.processing_config.styles
+            processor = Mock(client=client)
+            processors.append(processor)
+
+            def process_transcripts(received_transcripts, output_dir):
+                assert received_transcripts is transcripts
+                barrier.wait()
+                return [Mock(output_file_path=output_files[style])]
+
+            processor.process_transcripts.side_effect = process_transcripts
+            return processor
+
+        monkeypatch.setattr(
+            "getoutvideo_django.video_processor.services._PooledAIProcessor",
+            fake_ai_processor,
+        )
+
+        result = asyncio.run(service.aprocess_video(video_url=valid_video_url))
+
+        mock_getoutvideo_api.extract_transcripts.assert_called_once_with(
+            valid_video_url,
+        )
+        mock_getoutvideo_api.process_youtube_url.assert_not_called()
+        assert result["video_title"] == "TestVideo"
+        assert set(result["results"]) == {"summary", "educational", "balanced"}
+        # Every processor talks to the API through the same pooled client
+        assert len({id(processor.client) for processor in processors}) == 1
+
+    def test_one_openai_client_per_key(  # noqa: PLR0913
+        self,
+        service,
+        mock_getoutvideo_api,
+        monkeypatch,
+        valid_video_url,
+        default_styles,
+        default_style_files,
+    ):
+        """Test that every style of every request shares one OpenAI client."""
+        mock_getoutvideo_api.get_available_styles.return_value = default_styles
+        mock_getoutvideo_api.extract_transcripts.return_value = [
+            Mock(title="TestVideo"),
+        ]
+        output_files = dict(zip(default_styles, default_style_files, strict=True))
+        mock_openai = Mock()
+        monkeypatch.setattr(
+            "getoutvideo_django.video_processor.services.openai.OpenAI",
+            mock_openai,
+        )
+
+        def process_transcripts(processor, transcripts, output_dir):
+            assert processor.client is mock_openai.return_value
+            (style,) = processor.config.processing_config.styles
+            return [Mock(output_file_path=output_files[style])]
+
+        monkeypatch.setattr(
+            "getoutvideo_django.video_processor.services.AIProcessor.process_transcripts",
+            process_transcripts,
+        )
+
+        for _ in range(2):
+            asyncio.run(service.aprocess_video(video_url=valid_video_url))
+
+        mock_openai.assert_called_once_with(api_key="test-api-key")
+
+
+class TestPooledAIProcessor:
+    """Test _PooledAIProcessor against the SDK's AIProcessor."""
+
+    def test_matches_sdk_processor_state(self, monkeypatch):
+        """Test that the pooled processor sets every attribute the SDK's does."""
+        mock_openai = Mock()
+        monkeypatch.setattr(
+            "getoutvideo_django.video_processor.services.openai.OpenAI",
+            mock_openai,
+        )
+        config = APIConfig(openai_api_key="test-api-key")
+        client = Mock()
+
+        sdk_processor = AIProcessor(config)
+        pooled_processor = _PooledAIProcessor(config, client)
+
+        # Fails when an SDK update gives AIProcessor.__init__ new attributes
+        assert vars(pooled_processor) == {**vars(sdk_processor), "client": client}
+
+
+class TestSplitOutputStem:
+    """Test splitting output file names into video title and style."""
+
+    @pytest.mark.parametrize(
+        ("stem", "expected"),
+        [
+            (
+                "Rick_Astley_Never_Gonna [Summary]",
+                ("Rick_Astley_Never_Gonna", "Summary"),
+            ),
+            ("TestVideo [Q&A Generation]", ("TestVideo", "Q&A Generation")),
+            ("TestVideo_Summary", ("TestVideo", "Summary")),
+            ("TestVideo_Balanced_and_Detailed", ("TestVideo", "Balanced_and_Detailed")),
+            (
+                "My_Test_Video_Narrative_Rewriting",
+                ("My_Test_Video", "Narrative_Rewriting"),
+            ),
+            ("TestVideo_Summary_Extended", ("TestVideo", "Summary_Extended")),
+            ("TestVideo", None),
+        ],
+    )
+    def test_split_output_stem(self, stem, expected):
+        """Test title and style extraction for supported naming schemes."""
+        assert _split_output_stem(stem) == expected
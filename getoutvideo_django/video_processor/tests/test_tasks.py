@@ -0,0 +1,304 @@
+"""
+Tests for video processing Celery tasks.
+"""
+
+import logging
+import signal
+import threading
+import time
+from http import HTTPStatus
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
+from unittest.mock import Mock
+
+import pytest
+from celery.exceptions import SoftTimeLimitExceeded
+from django.core.cache import cache
+
+from getoutvideo_django.video_processor.exceptions import ConfigurationError
+from getoutvideo_django.video_processor.exceptions import ExternalServiceError
+from getoutvideo_django.video_processor.exceptions import VideoValidationError
+from getoutvideo_django.video_processor.models import VideoProcessingJob
+from getoutvideo_django.video_processor.responses import result_cache_key
+from getoutvideo_django.video_processor.services import VideoProcessingService
+from getoutvideo_django.video_processor.tasks import process_video_task
+from getoutvideo_django.video_processor.tasks import route_video_task
+from getoutvideo_django.video_processor.tests.factories import VideoProcessingJobFactory
+
+TASKS_LOGGER = "getoutvideo_django.video_processor.tasks"
+
+pytestmark = pytest.mark.django_db
+
+
+class TestRouteVideoTask:
+    """Test route_video_task behaviour."""
+
+    @pytest.fixture(autouse=True)
+    def mock_get_service(self, monkeypatch):
+        """Replace the task's service accessor with a mock."""
+        mock_get_service = MagicMock()
+        monkeypatch.setattr(
+            "getoutvideo_django.video_processor.tasks.get_service",
+            mock_get_service,
+        )
+        return mock_get_service
+
+    @pytest.fixture(autouse=True)
+    def mock_process_video_task(self, monkeypatch):
+        """Replace the processing task with a mock that queues nothing."""
+        mock_task = MagicMock()
+        monkeypatch.setattr(
+            "getoutvideo_django.video_processor.tasks.process_video_task",
+            mock_task,
+        )
+        return mock_task
+
+    @pytest.mark.parametrize(
+        ("duration", "expected_queue"),
+        [
+            (60, "video_processing_short"),
+            (5 * 60, "video_processing_short"),
+            (5 * 60 + 1, None),
+            (None, None),
+        ],
+    )
+    def test_routes_by_duration(
+        self,
+        mock_get_service,
+        mock_process_video_task,
+        duration,
+        expected_queue,
+    ):
+        """Test that short videos are queued apart from long ones."""
+        job = VideoProcessingJobFactory()
+        mock_get_service.return_value.get_video_duration.return_value = duration
+
+        route_video_task.apply(args=[str(job.pk)]).get()
+
+        mock_get_service.return_value.get_video_duration.assert_called_once_with(
+            job.video_url,
+        )
+        mock_process_video_task.apply_async.assert_called_once_with(
+            args=[str(job.pk)],
+            queue=expected_queue,
+        )
+
+    def test_lookup_error_uses_default_queue(
+        self,
+        mock_get_service,
+        mock_process_video_task,
+    ):
+        """Test that a failing duration lookup still queues the job."""
+        job = VideoProcessingJobFactory()
+        mock_get_service.side_effect = ConfigurationError()
+
+        route_video_task.apply(args=[str(job.pk)]).get()
+
+        mock_process_video_task.apply_async.assert_called_once_with(
+            args=[str(job.pk)],
+            queue=None,
+        )
+
+
+class TestProcessVideoTask:
+    """Test process_video_task behaviour."""
+
+    @pytest.fixture(autouse=True)
+    def mock_get_service(self, monkeypatch):
+        """Replace the task's service accessor with a mock."""
+        mock_get_service = MagicMock()
+        mock_get_service.return_value.aprocess_video = AsyncMock()
+        monkeypatch.setattr(
+            "getoutvideo_django.video_processor.tasks.get_service",
+            mock_get_service,
+        )
+        return mock_get_service
+
+    def test_records_service_result(
+        self,
+        mock_get_service,
+        mock_service_success_response,
+    ):
+        """Test that the task processes the job's inputs and stores the result."""
+        job = VideoProcessingJobFactory(styles=["Summary"])
+        mock_service = mock_get_service.return_value
+        mock_service.aprocess_video.return_value = mock_service_success_response
+
+        process_video_task.apply(args=[str(job.pk)]).get()
+
+        job.refresh_from_db()
+        assert job.status == VideoProcessingJob.Status.SUCCESS
+        assert job.result == mock_service_success_response
+        mock_service.aprocess_video.assert_awaited_once_with(
+            video_url=job.video_url,
+            styles=["Summary"],
+            output_language="English",
+        )
+
+    def test_caches_success_payload(
+        self,
+        mock_get_service,
+        mock_service_success_response,
+    ):
+        """Test that the task caches the success response for the job's inputs."""
+        job = VideoProcessingJobFactory()
+        mock_service = mock_get_service.return_value
+        mock_service.aprocess_video.return_value = mock_service_success_response
+
+        process_video_task.apply(args=[str(job.pk)]).get()
+
+        cached = cache.get(
+            result_cache_key(job.video_url, job.styles, job.output_language),
+        )
+        assert cached["status"] == "success"
+        assert cached["data"]["video_title"] == "Test Video"
+
+    def test_stores_validated_data(
+        self,
+        mock_get_service,
+        mock_service_success_response,
+    ):
+        """Test that the job stores the same data as the cached payload."""
+        job = VideoProcessingJobFactory()
+        mock_get_service.return_value.aprocess_video.return_value = {
+            **mock_service_success_response,
+            "unexpected": "Not part of the response format",
+        }
+
+        process_video_task.apply(args=[str(job.pk)]).get()
+
+        job.refresh_from_db()
+        cached = cache.get(
+            result_cache_key(job.video_url, job.styles, job.output_language),
+        )
+        assert "unexpected" not in job.result
+        assert cached == {"status": "success", "data": job.result}
+
+    def test_invalid_result_recorded_as_error(self, mock_get_service):
+        """Test that results not matching the response format fail the job."""
+        job = VideoProcessingJobFactory()
+        mock_get_service.return_value.aprocess_video.return_value = {
+            "invalid_structure": "This doesn't match expected response format",
+        }
+
+        result = process_video_task.apply(args=[str(job.pk)])
+
+        job.refresh_from_db()
+        assert result.failed()
+        assert job.status == VideoProcessingJob.Status.FAILURE
+        assert job.error_message == "Response formatting error"
+        assert job.error_code == HTTPStatus.INTERNAL_SERVER_ERROR
+        assert (
+            cache.get(
+                result_cache_key(job.video_url, job.styles, job.output_language),
+            )
+            is None
+        )
+
+    @pytest.mark.parametrize(
+        ("error", "expected_message", "expected_code"),
+        [
+            (
+                VideoValidationError("Bad URL"),
+                "Bad URL",
+                HTTPStatus.BAD_REQUEST,
+            ),
+            (
+                ExternalServiceError("External service unavailable"),
+                "External service unavailable",
+                HTTPStatus.BAD_GATEWAY,
+            ),
+            (
+                SoftTimeLimitExceeded(),
+                "Video processing timed out",
+                HTTPStatus.UNPROCESSABLE_ENTITY,
+            ),
+            (
+                Exception("Unexpected error"),
+                "An unexpected error occurred during video processing",
+                HTTPStatus.INTERNAL_SERVER_ERROR,
+            ),
+        ],
+    )
+    def test_records_error_response(
+        self,
+        mock_get_service,
+        error,
+        expected_message,
+        expected_code,
+    ):
+        """Test that failures are recorded on the job and fail the task."""
+        job = VideoProcessingJobFactory()
+        mock_get_service.return_value.aprocess_video.side_effect = error
+
+        result = process_video_task.apply(args=[str(job.pk)])
+
+        job.refresh_from_db()
+        assert result.failed()
+        assert job.status == VideoProcessingJob.Status.FAILURE
+        assert job.error_message == expected_message
+        assert job.error_code == expected_code
+
+    def test_soft_time_limit_does_not_wait_for_running_styles(
+        self,
+        settings,
+        monkeypatch,
+        mock_get_service,
+        mock_getoutvideo_api,
+        default_styles,
+    ):
+        """Test that a timeout is recorded while style threads are still running."""
+        settings.GETOUTVIDEO_CONFIG = {"OPENAI_API_KEY": "test-api-key"}
+        mock_get_service.return_value = VideoProcessingService()
+        mock_getoutvideo_api.get_available_styles.return_value = default_styles
+        mock_getoutvideo_api.extract_transcripts.return_value = [
+            Mock(title="TestVideo"),
+        ]
+        release = threading.Event()
+
+        def process_transcripts(transcripts, output_dir):
+            # Celery raises the soft time limit from a signal handler in the
+            # main thread; it fires while every style call is still blocked
+            signal.setitimer(signal.ITIMER_REAL, 0.1)
+            release.wait(10)
+            return []
+
+        monkeypatch.setattr(
+            "getoutvideo_django.video_processor.services._PooledAIProcessor",
+            Mock(return_value=Mock(process_transcripts=process_transcripts)),
+        )
+
+        def raise_soft_time_limit(signum, frame):
+            raise SoftTimeLimitExceeded
+
+        job = VideoProcessingJobFactory(styles=None)
+        previous_handler = signal.signal(signal.SIGALRM, raise_soft_time_limit)
+        start = time.monotonic()
+        try:
+            result = process_video_task.apply(args=[str(job.pk)])
+            elapsed = time.monotonic() - start
+        finally:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, previous_handler)
+            release.set()
+
+        job.refresh_from_db()
+        assert result.failed()
+        assert job.status == VideoProcessingJob.Status.FAILURE
+        assert job.error_message == "Video processing timed out"
+        # Well before the blocked style calls would have returned
+        assert elapsed < 5  # noqa: PLR2004
+
+    def test_service_error_logged_without_traceback(self, mock_get_service, caplog):
+        """Test that expected service errors are logged without a traceback."""
+        job = VideoProcessingJobFactory()
+        error = ExternalServiceError("External service unavailable")
+        mock_get_service.return_value.aprocess_video.side_effect = error
+
+        with caplog.at_level(logging.ERROR, logger=TASKS_LOGGER):
+            process_video_task.apply(args=[str(job.pk)])
+
+        (record,) = (r for r in caplog.records if r.name == TASKS_LOGGER)
+        assert record.getMessage() == "Service error: External service unavailable"
+        assert record.exc_info is None
+        assert record.status_code == HTTPStatus.BAD_GATEWAY
@@ -1,25 +1,42 @@
 """
-Tests for VideoProcessAPIView API endpoint.
+Tests for the video processing and job status API endpoints.
 """
 
-import json
+import logging
+from datetime import timedelta
 from http import HTTPStatus
-from unittest.mock import Mock
-from unittest.mock import patch
+from unittest.mock import MagicMock
 
 import pytest
-from django.test import RequestFactory
+from django.core.cache import cache
 from django.urls import reverse
+from django.utils import timezone
 from rest_framework.test import APIClient
+from rest_framework.test import APIRequestFactory
+from rest_framework.test import force_authenticate
 
 from getoutvideo_django.users.tests.factories import UserFactory
 from getoutvideo_django.video_processor.exceptions import ConfigurationError
-from getoutvideo_django.video_processor.exceptions import ExternalServiceError
-from getoutvideo_django.video_processor.exceptions import ProcessingTimeoutError
-from getoutvideo_django.video_processor.exceptions import VideoValidationError
+from getoutvideo_django.video_processor.models import VideoProcessingJob
+from getoutvideo_django.video_processor.responses import result_cache_key
+from getoutvideo_django.video_processor.tests.factories import VideoProcessingJobFactory
+from getoutvideo_django.video_processor.views import VideoJobStatusAPIView
 from getoutvideo_django.video_processor.views import VideoProcessAPIView
 
-pytestmark = pytest.mark.django_db
+VIEWS_LOGGER = "getoutvideo_django.video_processor.views"
+
+
+def _call_status_view(user, job_id, **extra):
+    """GET the job status view directly, skipping URL routing and middleware."""
+    request = APIRequestFactory().get("/", **extra)
+    force_authenticate(request, user=user)
+    return VideoJobStatusAPIView.as_view()(request, job_id=job_id)
+
+
+@pytest.fixture
+def unsaved_user():
+    """User that is never written to the database."""
+    return UserFactory.build()
 
 
 class TestVideoProcessAPIView:
@@ -31,98 +48,158 @@ class TestVideoProcessAPIView:
         return APIClient()
 
     @pytest.fixture
-    def user(self):
-        """Create test user."""
-        return UserFactory()
-
-    @pytest.fixture
-    def authenticated_client(self, api_client, user):
+    def authenticated_client(self, db, api_client, shared_user):
         """Create authenticated API client."""
-        api_client.force_authenticate(user=user)
+        api_client.force_authenticate(user=shared_user)
         return api_client
 
-    @pytest.fixture
-    def valid_request_data(self):
-        """Valid request data for testing."""
-        return {
-            "video_url": "https://www.youtube.com/watch?v=test123",
-            "styles": ["Summary", "Educational"],
-            "output_language": "English",
-        }
+    @pytest.fixture(autouse=True)
+    def mock_route_video_task(self, monkeypatch):
+        """Replace the view's Celery task with a mock that queues nothing."""
+        mock_task = MagicMock()
+        monkeypatch.setattr(
+            "getoutvideo_django.video_processor.views.route_video_task",
+            mock_task,
+        )
+        return mock_task
+
+    @pytest.fixture(autouse=True)
+    def mock_get_service(self, monkeypatch):
+        """Replace the view's service accessor with a mock storing nothing."""
+        mock_get_service = MagicMock()
+        mock_get_service.return_value.find_stored_result.return_value = None
+        monkeypatch.setattr(
+            "getoutvideo_django.video_processor.views.get_service",
+            mock_get_service,
+        )
+        return mock_get_service
 
-    @pytest.fixture
-    def mock_service_success_response(self):
-        """Mock successful service response."""
-        return {
-            "video_url": "https://www.youtube.com/watch?v=test123",
-            "video_title": "Test Video",
-            "processed_at": "2024-01-01T12:00:00Z",
-            "results": {
-                "summary": "Test summary content",
-                "educational": "Test educational content",
-            },
-            "metadata": {
-                "processing_time": 25.5,
-                "language": "English",
-                "styles_processed": ["Summary", "Educational"],
-            },
+    def test_post_success(  # noqa: PLR0913
+        self,
+        process_url,
+        mock_route_video_task,
+        authenticated_client,
+        valid_request_data,
+        valid_video_url,
+        django_capture_on_commit_callbacks,
+    ):
+        """Test that a valid request is stored as a job and queued by its key."""
+        with django_capture_on_commit_callbacks(execute=True):
+            response = authenticated_client.post(
+                process_url,
+                data=valid_request_data,
+                format="json",
+            )
+
+        job = VideoProcessingJob.objects.get()
+        assert response.status_code == HTTPStatus.ACCEPTED
+        assert response.json() == {
+            "status": "accepted",
+            "job_id": str(job.pk),
+            "status_url": reverse(
+                "video_processor:video-job-status",
+                kwargs={"job_id": job.pk},
+            ),
         }
 
-    @pytest.fixture
-    def rf(self):
-        """Request factory for creating test requests."""
-        return RequestFactory()
+        # Verify the job holds the request and only its key was queued
+        assert job.status == VideoProcessingJob.Status.PENDING
+        assert job.video_url == valid_video_url
+        assert job.styles == ["Summary", "Educational"]
+        assert job.output_language == "English"
+        mock_route_video_task.delay.assert_called_once_with(str(job.pk))
 
-    def test_post_success(
+    @pytest.mark.django_db
+    def test_post_stored_result(  # noqa: PLR0913
         self,
+        process_url,
+        mock_get_service,
+        mock_route_video_task,
         authenticated_client,
         valid_request_data,
         mock_service_success_response,
+        valid_video_url,
     ):
-        """Test successful video processing request."""
-        with patch(
-            "getoutvideo_django.video_processor.views.VideoProcessingService",
-        ) as mock_service_class:
-            mock_service = Mock()
-            mock_service_class.return_value = mock_service
-            mock_service.process_video.return_value = mock_service_success_response
+        """Test that a fully stored result is returned without queueing a job."""
+        mock_service = mock_get_service.return_value
+        mock_service.find_stored_result.return_value = mock_service_success_response
 
-            response = authenticated_client.post(
-                reverse("video_processor:process-video"),
-                data=valid_request_data,
-                format="json",
-            )
+        response = authenticated_client.post(
+            process_url,
+            data=valid_request_data,
+            format="json",
+        )
 
         assert response.status_code == HTTPStatus.OK
         response_data = response.json()
-
         assert response_data["status"] == "success"
-        assert (
-            response_data["data"]["video_url"]
-            == "https://www.youtube.com/watch?v=test123"
+        assert response_data["data"]["video_url"] == valid_video_url
+        mock_route_video_task.delay.assert_not_called()
+
+    def test_post_cached_response(
+        self,
+        process_url,
+        mock_route_video_task,
+        authenticated_client,
+        valid_request_data,
+        mock_service_success_response,
+    ):
+        """Test that a cached response is returned without any processing."""
+        cached_response = {"status": "success", "data": mock_service_success_response}
+        cache.set(
+            result_cache_key(
+                valid_request_data["video_url"],
+                list(reversed(valid_request_data["styles"])),
+                valid_request_data["output_language"],
+            ),
+            cached_response,
         )
-        assert response_data["data"]["video_title"] == "Test Video"
-        assert "results" in response_data["data"]
-        assert "metadata" in response_data["data"]
-
-        # Verify service was called with correct parameters
-        mock_service.process_video.assert_called_once_with(
-            video_url="https://www.youtube.com/watch?v=test123",
-            styles=["Summary", "Educational"],
-            output_language="English",
+
+        response = authenticated_client.post(
+            process_url,
+            data=valid_request_data,
+            format="json",
         )
 
-    def test_post_unauthenticated(self, api_client, valid_request_data):
-        """Test request without authentication."""
+        assert response.status_code == HTTPStatus.OK
+        assert response.json() == cached_response
+        mock_route_video_task.delay.assert_not_called()
+
+    def test_post_stored_result_lookup_error(  # noqa: PLR0913
+        self,
+        process_url,
+        mock_get_service,
+        mock_route_video_task,
+        authenticated_client,
+        valid_request_data,
+        django_capture_on_commit_callbacks,
+    ):
+        """Test that a failing stored result lookup still queues the job."""
+        mock_service = mock_get_service.return_value
+        mock_service.find_stored_result.side_effect = ConfigurationError()
+
+        with django_capture_on_commit_callbacks(execute=True):
+            response = authenticated_client.post(
+                process_url,
+                data=valid_request_data,
+                format="json",
+            )
+
+        assert response.status_code == HTTPStatus.ACCEPTED
+        mock_route_video_task.delay.assert_called_once()
+
+    @pytest.mark.django_db
+    def test_post_unauthenticated(self, process_url, api_client, valid_request_data):
+        """Test that requests without authentication are accepted."""
         response = api_client.post(
-            reverse("video_processor:process-video"),
+            process_url,
             data=valid_request_data,
             format="json",
         )
 
-        assert response.status_code == HTTPStatus.FORBIDDEN
+        assert response.status_code == HTTPStatus.ACCEPTED
 
-    def test_post_invalid_request_data(self, authenticated_client):
+    def test_post_invalid_request_data(self, process_url, authenticated_client):
         """Test request with invalid data."""
         invalid_data = {
             "video_url": "not-a-valid-url",
@@ -130,7 +207,7 @@ class TestVideoProcessAPIView:
         }
 
         response = authenticated_client.post(
-            reverse("video_processor:process-video"),
+            process_url,
             data=invalid_data,
             format="json",
         )
@@ -141,7 +218,7 @@ class TestVideoProcessAPIView:
         assert response_data["error"] == "Invalid request data"
         assert "details" in response_data
 
-    def test_post_missing_required_field(self, authenticated_client):
+    def test_post_missing_required_field(self, process_url, authenticated_client):
         """Test request with missing required video_url field."""
         incomplete_data = {
             "styles": ["Summary"],
@@ -149,7 +226,7 @@ class TestVideoProcessAPIView:
         }
 
         response = authenticated_client.post(
-            reverse("video_processor:process-video"),
+            process_url,
             data=incomplete_data,
             format="json",
         )
@@ -159,366 +236,321 @@ class TestVideoProcessAPIView:
         assert response_data["status"] == "error"
         assert "video_url" in response_data["details"]
 
-    def test_post_video_validation_error(
+    def test_post_optional_fields(
         self,
+        process_url,
         authenticated_client,
-        valid_request_data,
+        valid_video_url,
     ):
-        """Test handling of VideoValidationError."""
-        with patch(
-            "getoutvideo_django.video_processor.views.VideoProcessingService",
-        ) as mock_service_class:
-            mock_service = Mock()
-            mock_service_class.return_value = mock_service
-            mock_service.process_video.side_effect = VideoValidationError(
-                "Invalid video URL",
-            )
+        """Test request with only required fields (optional fields omitted)."""
+        minimal_data = {
+            "video_url": valid_video_url,
+        }
 
-            response = authenticated_client.post(
-                reverse("video_processor:process-video"),
-                data=valid_request_data,
-                format="json",
-            )
+        response = authenticated_client.post(
+            process_url,
+            data=minimal_data,
+            format="json",
+        )
 
-        assert response.status_code == HTTPStatus.BAD_REQUEST
-        response_data = response.json()
-        assert response_data["status"] == "error"
-        assert response_data["error"] == "Invalid video URL"
+        assert response.status_code == HTTPStatus.ACCEPTED
 
-    def test_post_processing_timeout_error(
-        self,
-        authenticated_client,
-        valid_request_data,
-    ):
-        """Test handling of ProcessingTimeoutError."""
-        with patch(
-            "getoutvideo_django.video_processor.views.VideoProcessingService",
-        ) as mock_service_class:
-            mock_service = Mock()
-            mock_service_class.return_value = mock_service
-            mock_service.process_video.side_effect = ProcessingTimeoutError(
-                "Processing timed out",
-            )
+        # Verify the job was stored with defaults
+        job = VideoProcessingJob.objects.get()
+        assert job.styles is None  # Should be None when not provided
+        assert job.output_language == "English"  # Default value
 
-            response = authenticated_client.post(
-                reverse("video_processor:process-video"),
-                data=valid_request_data,
-                format="json",
-            )
+    def test_get_method_not_allowed(self, process_url, authenticated_client):
+        """Test that GET requests are not allowed."""
+        response = authenticated_client.get(process_url)
+        assert response.status_code == HTTPStatus.METHOD_NOT_ALLOWED
 
-        assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
-        response_data = response.json()
-        assert response_data["status"] == "error"
-        assert response_data["error"] == "Processing timed out"
-
-    def test_post_configuration_error(self, authenticated_client, valid_request_data):
-        """Test handling of ConfigurationError."""
-        with patch(
-            "getoutvideo_django.video_processor.views.VideoProcessingService",
-        ) as mock_service_class:
-            mock_service = Mock()
-            mock_service_class.return_value = mock_service
-            mock_service.process_video.side_effect = ConfigurationError(
-                "API key not configured",
-            )
+    def test_put_method_not_allowed(self, process_url, authenticated_client):
+        """Test that PUT requests are not allowed."""
+        response = authenticated_client.put(
+            process_url,
+            data={"test": "data"},
+            format="json",
+        )
+        assert response.status_code == HTTPStatus.METHOD_NOT_ALLOWED
 
-            response = authenticated_client.post(
-                reverse("video_processor:process-video"),
-                data=valid_request_data,
-                format="json",
-            )
+    def test_delete_method_not_allowed(self, process_url, authenticated_client):
+        """Test that DELETE requests are not allowed."""
+        response = authenticated_client.delete(process_url)
+        assert response.status_code == HTTPStatus.METHOD_NOT_ALLOWED
 
-        assert response.status_code == HTTPStatus.INTERNAL_SERVER_ERROR
-        response_data = response.json()
-        assert response_data["status"] == "error"
-        assert response_data["error"] == "API key not configured"
+    def test_throttling_configuration(self):
+        """Test that throttling is properly configured on the view."""
+        throttle_class_names = [
+            cls.__name__ for cls in VideoProcessAPIView.throttle_classes
+        ]
+        assert throttle_class_names == ["ScopedRateThrottle"]
+        assert VideoProcessAPIView.throttle_scope == "video_process"
 
-    def test_post_external_service_error(
+    def test_permission_classes(self):
+        """Test that the endpoint is open to anonymous clients."""
+        permission_class_names = [
+            cls.__name__ for cls in VideoProcessAPIView.permission_classes
+        ]
+        assert permission_class_names == ["AllowAny"]
+
+    def test_logging_on_request(  # noqa: PLR0913
         self,
-        authenticated_client,
+        process_url,
+        db,
+        api_client,
+        shared_user,
         valid_request_data,
+        valid_video_url,
+        caplog,
     ):
-        """Test handling of ExternalServiceError."""
-        with patch(
-            "getoutvideo_django.video_processor.views.VideoProcessingService",
-        ) as mock_service_class:
-            mock_service = Mock()
-            mock_service_class.return_value = mock_service
-            mock_service.process_video.side_effect = ExternalServiceError(
-                "External service unavailable",
-            )
-
-            response = authenticated_client.post(
-                reverse("video_processor:process-video"),
-                data=valid_request_data,
-                format="json",
-            )
-
-        assert response.status_code == HTTPStatus.BAD_GATEWAY
-        response_data = response.json()
-        assert response_data["status"] == "error"
-        assert response_data["error"] == "External service unavailable"
-
-    def test_post_unexpected_error(self, authenticated_client, valid_request_data):
-        """Test handling of unexpected exceptions."""
-        with patch(
-            "getoutvideo_django.video_processor.views.VideoProcessingService",
-        ) as mock_service_class:
-            mock_service = Mock()
-            mock_service_class.return_value = mock_service
-            mock_service.process_video.side_effect = Exception("Unexpected error")
-
-            response = authenticated_client.post(
-                reverse("video_processor:process-video"),
+        """Test that appropriate logging occurs during request processing."""
+        # A real session, since the user is only looked up for requests that
+        # carry credentials
+        api_client.force_login(shared_user)
+        with caplog.at_level(logging.INFO, logger=VIEWS_LOGGER):
+            api_client.post(
+                process_url,
                 data=valid_request_data,
                 format="json",
             )
 
-        assert response.status_code == HTTPStatus.INTERNAL_SERVER_ERROR
-        response_data = response.json()
-        assert response_data["status"] == "error"
+        # Verify logging calls
+        messages = [
+            record.getMessage()
+            for record in caplog.records
+            if record.levelno == logging.INFO
+        ]
+        job = VideoProcessingJob.objects.get()
+        assert "Processing video request from user testuser" in messages
         assert (
-            response_data["error"]
-            == "An unexpected error occurred during video processing"
+            f"Queued video processing job {job.pk} for URL: {valid_video_url}"
+            in messages
         )
 
-    def test_post_optional_fields(
+    def test_logging_anonymous_request(
         self,
-        authenticated_client,
-        mock_service_success_response,
+        process_url,
+        db,
+        api_client,
+        caplog,
     ):
-        """Test request with only required fields (optional fields omitted)."""
-        minimal_data = {
-            "video_url": "https://www.youtube.com/watch?v=test123",
-        }
-
-        with patch(
-            "getoutvideo_django.video_processor.views.VideoProcessingService",
-        ) as mock_service_class:
-            mock_service = Mock()
-            mock_service_class.return_value = mock_service
-            mock_service.process_video.return_value = mock_service_success_response
-
-            response = authenticated_client.post(
-                reverse("video_processor:process-video"),
-                data=minimal_data,
-                format="json",
-            )
-
-        assert response.status_code == HTTPStatus.OK
+        """Test that requests without credentials are logged as anonymous."""
+        with caplog.at_level(logging.INFO, logger=VIEWS_LOGGER):
+            api_client.post(process_url, data={"invalid": "data"}, format="json")
 
-        # Verify service was called with defaults
-        mock_service.process_video.assert_called_once_with(
-            video_url="https://www.youtube.com/watch?v=test123",
-            styles=None,  # Should be None when not provided
-            output_language="English",  # Default value
-        )
+        messages = [record.getMessage() for record in caplog.records]
+        assert "Processing video request from user anonymous" in messages
 
-    def test_response_serialization_error(
+    def test_logging_on_validation_error(
         self,
+        process_url,
         authenticated_client,
-        valid_request_data,
+        caplog,
     ):
-        """Test handling when response serialization fails."""
-        invalid_service_response = {
-            "invalid_structure": "This doesn't match expected response format",
-        }
-
-        with patch(
-            "getoutvideo_django.video_processor.views.VideoProcessingService",
-        ) as mock_service_class:
-            mock_service = Mock()
-            mock_service_class.return_value = mock_service
-            mock_service.process_video.return_value = invalid_service_response
+        """Test logging for validation errors."""
+        invalid_data = {"invalid": "data"}
 
-            response = authenticated_client.post(
-                reverse("video_processor:process-video"),
-                data=valid_request_data,
+        with caplog.at_level(logging.WARNING, logger=VIEWS_LOGGER):
+            authenticated_client.post(
+                process_url,
+                data=invalid_data,
                 format="json",
             )
 
-        assert response.status_code == HTTPStatus.INTERNAL_SERVER_ERROR
-        response_data = response.json()
-        assert response_data["status"] == "error"
-        assert response_data["error"] == "Response formatting error"
+        # Verify warning log for invalid request data
+        warnings = [
+            record for record in caplog.records if record.levelno == logging.WARNING
+        ]
+        assert warnings
+        assert "Invalid request data" in warnings[0].msg
 
-    def test_error_response_serialization_fallback(
+    @pytest.mark.parametrize(
+        "url",
+        [
+            "https://www.youtube.com/watch?v=test123",
+            "https://youtube.com/watch?v=test123",
+            "https://youtu.be/test123",
+            "https://www.youtube.com/embed/test123",
+            "https://www.youtube.com/v/test123",
+        ],
+    )
+    def test_different_youtube_url_formats(
         self,
+        process_url,
         authenticated_client,
-        valid_request_data,
+        url,
     ):
-        """Test fallback when error response serialization also fails."""
-        with patch(
-            "getoutvideo_django.video_processor.views.VideoProcessingService",
-        ) as mock_service_class:
-            mock_service = Mock()
-            mock_service_class.return_value = mock_service
-            mock_service.process_video.side_effect = Exception("Test error")
-
-            # Also patch the error serializer to fail
-            with patch(
-                "getoutvideo_django.video_processor.views.ErrorResponseSerializer",
-            ) as mock_error_serializer:
-                mock_error_serializer.return_value.is_valid.return_value = False
-
-                response = authenticated_client.post(
-                    reverse("video_processor:process-video"),
-                    data=valid_request_data,
-                    format="json",
-                )
-
-        assert response.status_code == HTTPStatus.INTERNAL_SERVER_ERROR
-        response_data = response.json()
-        assert response_data["status"] == "error"
-        assert (
-            response_data["error"]
-            == "An unexpected error occurred during video processing"
+        """Test different valid YouTube URL formats."""
+        response = authenticated_client.post(
+            process_url,
+            data={"video_url": url},
+            format="json",
         )
 
-    def test_get_method_not_allowed(self, authenticated_client):
-        """Test that GET requests are not allowed."""
-        response = authenticated_client.get(reverse("video_processor:process-video"))
-        assert response.status_code == HTTPStatus.METHOD_NOT_ALLOWED
+        assert response.status_code == HTTPStatus.ACCEPTED
 
-    def test_put_method_not_allowed(self, authenticated_client):
-        """Test that PUT requests are not allowed."""
-        response = authenticated_client.put(
-            reverse("video_processor:process-video"),
-            data={"test": "data"},
-            format="json",
-        )
-        assert response.status_code == HTTPStatus.METHOD_NOT_ALLOWED
 
-    def test_delete_method_not_allowed(self, authenticated_client):
-        """Test that DELETE requests are not allowed."""
-        response = authenticated_client.delete(reverse("video_processor:process-video"))
-        assert response.status_code == HTTPStatus.METHOD_NOT_ALLOWED
+class TestVideoJobStatusAPIView:
+    """Tests for VideoJobStatusAPIView endpoint."""
 
-    def test_throttling_configuration(self, rf, user):
-        """Test that throttling is properly configured on the view."""
-        view = VideoProcessAPIView()
-        request = rf.post("/fake-url/")
-        request.user = user
-
-        # Check that throttling classes are configured
-        assert hasattr(view, "throttle_classes")
-        throttle_class_names = [cls.__name__ for cls in view.throttle_classes]
-        assert "AnonRateThrottle" in throttle_class_names
-        assert "UserRateThrottle" in throttle_class_names
-
-    def test_permission_classes(self, rf, user):
-        """Test that authentication is required."""
-        view = VideoProcessAPIView()
-        request = rf.post("/fake-url/")
-        request.user = user
-
-        # Check that IsAuthenticated permission is configured
-        assert hasattr(view, "permission_classes")
-        permission_class_names = [cls.__name__ for cls in view.permission_classes]
-        assert "IsAuthenticated" in permission_class_names
-
-    def test_logging_on_request(
-        self,
-        authenticated_client,
-        valid_request_data,
-        mock_service_success_response,
-    ):
-        """Test that appropriate logging occurs during request processing."""
-        with patch(
-            "getoutvideo_django.video_processor.views.VideoProcessingService",
-        ) as mock_service_class:
-            mock_service = Mock()
-            mock_service_class.return_value = mock_service
-            mock_service.process_video.return_value = mock_service_success_response
-
-            with patch(
-                "getoutvideo_django.video_processor.views.logger",
-            ) as mock_logger:
-                authenticated_client.post(
-                    reverse("video_processor:process-video"),
-                    data=valid_request_data,
-                    format="json",
-                )
-
-                # Verify logging calls
-                mock_logger.info.assert_any_call(
-                    "Processing video request from user %s",
-                    "testuser",
-                )
-                mock_logger.info.assert_any_call(
-                    "Starting video processing for URL: %s",
-                    "https://www.youtube.com/watch?v=test123",
-                )
-                mock_logger.info.assert_any_call(
-                    "Video processing completed successfully for URL: %s",
-                    "https://www.youtube.com/watch?v=test123",
-                )
-
-    def test_logging_on_validation_error(self, authenticated_client):
-        """Test logging for validation errors."""
-        invalid_data = {"invalid": "data"}
+    pytestmark = pytest.mark.django_db
 
-        with patch("getoutvideo_django.video_processor.views.logger") as mock_logger:
-            authenticated_client.post(
-                reverse("video_processor:process-video"),
-                data=invalid_data,
-                format="json",
-            )
+    @pytest.mark.parametrize(
+        "job_status",
+        [VideoProcessingJob.Status.PENDING, VideoProcessingJob.Status.PROCESSING],
+    )
+    def test_get_unfinished_job(self, unsaved_user, job_status):
+        """Test that unfinished jobs report their status."""
+        job = VideoProcessingJobFactory(status=job_status)
+
+        response = _call_status_view(unsaved_user, job.pk)
 
-            # Verify warning log for invalid request data
-            mock_logger.warning.assert_called()
-            log_call_args = mock_logger.warning.call_args[0]
-            assert "Invalid request data" in log_call_args[0]
+        assert response.status_code == HTTPStatus.OK
+        assert response.data == {"status": job_status, "job_id": str(job.pk)}
 
-    def test_content_type_json_required(
+    def test_get_success(
         self,
-        authenticated_client,
-        valid_request_data,
+        unsaved_user,
         mock_service_success_response,
+        valid_video_url,
     ):
-        """Test that JSON content type is properly handled."""
-        with patch(
-            "getoutvideo_django.video_processor.views.VideoProcessingService",
-        ) as mock_service_class:
-            mock_service = Mock()
-            mock_service_class.return_value = mock_service
-            mock_service.process_video.return_value = mock_service_success_response
-
-            # Test with JSON content type
-            response = authenticated_client.post(
-                reverse("video_processor:process-video"),
-                data=json.dumps(valid_request_data),
-                content_type="application/json",
-            )
+        """Test that a finished job returns the processed video."""
+        job = VideoProcessingJobFactory(
+            status=VideoProcessingJob.Status.SUCCESS,
+            result=mock_service_success_response,
+        )
+
+        response = _call_status_view(unsaved_user, job.pk)
 
         assert response.status_code == HTTPStatus.OK
+        assert response.data["status"] == "success"
+        assert response.data["data"]["video_url"] == valid_video_url
+        assert response.data["data"]["video_title"] == "Test Video"
+        assert "results" in response.data["data"]
+        assert "metadata" in response.data["data"]
 
-    def test_different_youtube_url_formats(
+    def test_get_success_leaves_cache_alone(
         self,
-        authenticated_client,
+        unsaved_user,
         mock_service_success_response,
+        valid_request_data,
     ):
-        """Test different valid YouTube URL formats."""
-        youtube_urls = [
-            "https://www.youtube.com/watch?v=test123",
-            "https://youtube.com/watch?v=test123",
-            "https://youtu.be/test123",
-            "https://www.youtube.com/embed/test123",
-            "https://www.youtube.com/v/test123",
-        ]
+        """Test that polling a finished job does not write the result cache."""
+        job = VideoProcessingJobFactory(
+            **valid_request_data,
+            status=VideoProcessingJob.Status.SUCCESS,
+            result=mock_service_success_response,
+        )
+
+        _call_status_view(unsaved_user, job.pk)
+
+        assert cache.get(result_cache_key(**valid_request_data)) is None
+
+    def test_renders_json_regardless_of_accept(self, unsaved_user):
+        """Test that the Accept header does not change the response format."""
+        job = VideoProcessingJobFactory()
+
+        response = _call_status_view(unsaved_user, job.pk, HTTP_ACCEPT="text/html")
+        response.render()
+
+        assert response.status_code == HTTPStatus.OK
+        assert response["Content-Type"] == "application/json"
+
+    def test_unchanged_job_not_modified(self, unsaved_user):
+        """Test that polls repeating the job's ETag get an empty 304."""
+        job = VideoProcessingJobFactory()
+        etag = _call_status_view(unsaved_user, job.pk)["ETag"]
+
+        response = _call_status_view(unsaved_user, job.pk, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == HTTPStatus.NOT_MODIFIED
+        assert response["ETag"] == etag
+        assert not response.content
+
+    def test_changed_job_gets_new_etag(self, unsaved_user):
+        """Test that a state change answers a stale ETag with the new state."""
+        job = VideoProcessingJobFactory()
+        etag = _call_status_view(unsaved_user, job.pk)["ETag"]
+        job.mark_processing()
+
+        response = _call_status_view(unsaved_user, job.pk, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == HTTPStatus.OK
+        assert response.data["status"] == VideoProcessingJob.Status.PROCESSING
+        assert response["ETag"] != etag
+
+    def test_abandoned_job_reported_as_timeout(self, settings, unsaved_user):
+        """Test that a job processing past the task time limit has timed out."""
+        job = VideoProcessingJobFactory(status=VideoProcessingJob.Status.PROCESSING)
+        etag = _call_status_view(unsaved_user, job.pk)["ETag"]
+        # The worker was killed without recording an outcome
+        VideoProcessingJob.objects.filter(pk=job.pk).update(
+            updated_at=timezone.now()
+            - timedelta(seconds=settings.CELERY_TASK_TIME_LIMIT + 1),
+        )
+
+        response = _call_status_view(unsaved_user, job.pk, HTTP_IF_NONE_MATCH=etag)
+
+        job.refresh_from_db()
+        assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+        assert response.data["error"] == "Video processing timed out"
+        assert job.status == VideoProcessingJob.Status.FAILURE
+
+    def test_get_failed_job(self, unsaved_user):
+        """Test that a failed job returns the error response it recorded."""
+        job = VideoProcessingJobFactory(
+            status=VideoProcessingJob.Status.FAILURE,
+            error_message="Video processing timed out",
+            error_code=HTTPStatus.UNPROCESSABLE_ENTITY,
+        )
+
+        response = _call_status_view(unsaved_user, job.pk)
+
+        assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+        assert response.data == {
+            "status": "error",
+            "error": "Video processing timed out",
+            "code": str(HTTPStatus.UNPROCESSABLE_ENTITY.value),
+        }
+
+    def test_get_unknown_job(self, unsaved_user):
+        """Test that unknown job ids are not found."""
+        response = _call_status_view(unsaved_user, VideoProcessingJobFactory.build().pk)
+
+        assert response.status_code == HTTPStatus.NOT_FOUND
+
+    def test_repeated_errors_share_payload(self, unsaved_user):
+        """Test that identical errors reuse one cached payload."""
+        jobs = VideoProcessingJobFactory.create_batch(
+            2,
+            status=VideoProcessingJob.Status.FAILURE,
+            error_message="Bad URL",
+            error_code=HTTPStatus.BAD_REQUEST,
+        )
+
+        first, second = (_call_status_view(unsaved_user, job.pk) for job in jobs)
+
+        assert first.data is second.data
+
+    def test_error_response_serialization_fallback(self, unsaved_user):
+        """Test fallback when the error message is not a valid error string."""
+        job = VideoProcessingJobFactory(
+            status=VideoProcessingJob.Status.FAILURE,
+            error_message="",
+            error_code=HTTPStatus.BAD_GATEWAY,
+        )
+
+        response = _call_status_view(unsaved_user, job.pk)
+
+        assert response.status_code == HTTPStatus.BAD_GATEWAY
+        assert response.data == {"status": "error", "error": ""}
+
+    def test_status_url_rejects_malformed_job_id(self, shared_user):
+        """Test that only UUID job ids resolve to the status endpoint."""
+        client = APIClient()
+        client.force_authenticate(user=shared_user)
+
+        response = client.get("/api/v1/video/jobs/not-a-job/")
 
-        with patch(
-            "getoutvideo_django.video_processor.views.VideoProcessingService",
-        ) as mock_service_class:
-            mock_service = Mock()
-            mock_service_class.return_value = mock_service
-            mock_service.process_video.return_value = mock_service_success_response
-
-            for url in youtube_urls:
-                response = authenticated_client.post(
-                    reverse("video_processor:process-video"),
-                    data={"video_url": url},
-                    format="json",
-                )
-
-                assert response.status_code == HTTPStatus.OK, f"Failed for URL: {url}"
+        assert response.status_code == HTTPStatus.NOT_FOUND
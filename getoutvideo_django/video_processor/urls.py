@@ -14,4 +14,9 @@ urlpatterns = [
         views.VideoProcessAPIView.as_view(),
         name="process-video",
     ),
+    path(
+        "api/v1/video/jobs/<uuid:job_id>/",
+        views.VideoJobStatusAPIView.as_view(),
+        name="video-job-status",
+    ),
 ]
@@ -2,41 +2,169 @@
 API views for video processing operations.
 """
 
+import functools
 import logging
 
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.shortcuts import get_object_or_404
+from django.urls import reverse
+from django.utils.cache import get_conditional_response
+from django.utils.http import quote_etag
+from rest_framework import serializers
 from rest_framework import status
 from rest_framework.permissions import AllowAny
+from rest_framework.renderers import BaseRenderer
 from rest_framework.response import Response
-from rest_framework.throttling import AnonRateThrottle
-from rest_framework.throttling import UserRateThrottle
+from rest_framework.throttling import BaseThrottle
+from rest_framework.throttling import ScopedRateThrottle
 from rest_framework.views import APIView
 
-from .exceptions import ConfigurationError
-from .exceptions import ExternalServiceError
 from .exceptions import ProcessingTimeoutError
-from .exceptions import VideoValidationError
-from .serializers import ErrorResponseSerializer
+from .exceptions import VideoProcessorError
+from .models import VideoProcessingJob
+from .renderers import ORJSONRenderer
+from .responses import result_cache_key
+from .responses import success_payload
 from .serializers import VideoProcessRequestSerializer
-from .serializers import VideoProcessResponseSerializer
-from .services import VideoProcessingService
+from .services import get_service
+from .tasks import route_video_task
 
 logger = logging.getLogger(__name__)
 
+# Unbound serializer reused to validate every request; its field tree is built
+# once, and run_validation() keeps no per-call state, so one instance is safe
+# to share across requests
+_REQUEST_SERIALIZER = VideoProcessRequestSerializer()
 
-class VideoProcessAPIView(APIView):
+
+def _user_label(request):
+    """
+    Return the name to log for the user making a request.
+
+    Requests carrying neither an Authorization header nor a session cookie
+    cannot authenticate anyone, so they are labelled without resolving
+    request.user and the session or credential lookups that go with it.
+    """
+    if (
+        "HTTP_AUTHORIZATION" not in request.META
+        and settings.SESSION_COOKIE_NAME not in request.COOKIES
+    ):
+        return "anonymous"
+    user = request.user
+    return user.username if user.is_authenticated else "anonymous"
+
+
+@functools.lru_cache(maxsize=64)
+def _error_body(message: str, status_code: int) -> dict[str, str]:
+    """
+    Return the error payload for a message and status code.
+
+    Errors repeat a handful of messages, so payloads are built once and shared
+    by every response carrying them; responses only read their data.
+    """
+    return {"status": "error", "error": message.strip(), "code": str(status_code)}
+
+
+# Renderer instances shared by every response, one per renderer class
+_SHARED_RENDERERS: dict[type[BaseRenderer], BaseRenderer] = {}
+
+
+def _shared_renderer(renderer_class: type[BaseRenderer]) -> BaseRenderer:
+    """Return one instance of a renderer class, shared by every response."""
+    renderer = _SHARED_RENDERERS.get(renderer_class)
+    if renderer is None:
+        renderer = _SHARED_RENDERERS.setdefault(renderer_class, renderer_class())
+    return renderer
+
+
+class SingleRendererMixin:
+    """
+    Skips content negotiation for views that render a single format.
+
+    Negotiating could only pick the view's one renderer or reject the request
+    with 406, so the Accept header is not parsed and clients always get the
+    view's format.
+    """
+
+    renderer_classes: list[type[BaseRenderer]]
+
+    def perform_content_negotiation(self, request, force=False):  # noqa: FBT002
+        """Return the view's renderer and its media type."""
+        renderer = _shared_renderer(self.renderer_classes[0])
+        return renderer, renderer.media_type
+
+
+class VideoResponseMixin:
+    """Builds the success and error payloads shared by the video endpoints."""
+
+    def _create_success_response(self, result_data, video_url, cache_key=None):
+        """
+        Create and validate a success response.
+
+        When cache_key is given, the validated payload is cached under it so
+        identical requests are answered without processing or validation.
+        """
+        # Validate response format
+        try:
+            validated_data = success_payload(result_data)
+        except serializers.ValidationError as e:
+            # An expected validation outcome, so no traceback is logged
+            logger.error("Response serialization failed: %s", e.detail)  # noqa: TRY400
+            return self._error_response(
+                "Response formatting error",
+                status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+        logger.info(
+            "Video processing completed successfully for URL: %s",
+            video_url,
+        )
+        if cache_key is not None:
+            cache.set(cache_key, validated_data, timeout=settings.VIDEO_RESULT_TTL)
+        return Response(validated_data, status=status.HTTP_200_OK)
+
+    def _error_response(self, message: str, status_code: int) -> Response:
+        """
+        Create a standardized error response.
+
+        Args:
+            message: Error message to return
+            status_code: HTTP status code
+
+        Returns:
+            Response: Formatted error response
+        """
+        # Inline equivalent of ErrorResponseSerializer validation: the payload
+        # is built here from a message and a status code, so checking the
+        # message is all its CharFields would do
+        if not isinstance(message, str) or not message.strip():
+            # Fallback if the message is not a valid error string
+            return Response(
+                {"status": "error", "error": message},
+                status=status_code,
+            )
+        return Response(_error_body(message, status_code), status=status_code)
+
+
+class VideoProcessAPIView(SingleRendererMixin, VideoResponseMixin, APIView):
     """
     API endpoint for processing YouTube videos.
 
-    Accepts POST requests with YouTube video URLs and processing parameters,
-    returns processed video content in multiple styles.
+    Accepts POST requests with YouTube video URLs and processing parameters
+    and queues them for a Celery worker; clients poll the returned status URL
+    for the processed video content.
     """
 
     permission_classes = [AllowAny]
-    throttle_classes = [AnonRateThrottle, UserRateThrottle]
+    throttle_classes = [ScopedRateThrottle]
+    throttle_scope = "video_process"
+    renderer_classes = [ORJSONRenderer]
 
     def post(self, request):
         """
-        Process a YouTube video and return structured results.
+        Queue a YouTube video for processing.
 
         Expected request format:
         {
@@ -46,123 +174,139 @@ class VideoProcessAPIView(APIView):
         }
 
         Returns:
-        - 200: Successfully processed video with results
-        - 400: Invalid request data or video URL
-        - 422: Processing timeout
-        - 500: Configuration error
-        - 502: External service error
+        - 202: Video queued, with the job id and its status URL
+        - 400: Invalid request data
         """
-        logger.info(
-            "Processing video request from user %s",
-            request.user.username if request.user.is_authenticated else "anonymous",
-        )
+        # The user label is only worth computing when the record is emitted
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Processing video request from user %s",
+                _user_label(request),
+            )
 
         # Validate request data
-        request_serializer = VideoProcessRequestSerializer(data=request.data)
-        if not request_serializer.is_valid():
-            logger.warning(
-                "Invalid request data: %s",
-                request_serializer.errors,
-            )
+        try:
+            validated_data = _REQUEST_SERIALIZER.run_validation(request.data)
+        except serializers.ValidationError as e:
+            logger.warning("Invalid request data: %s", e.detail)
             return Response(
                 {
                     "status": "error",
                     "error": "Invalid request data",
-                    "details": request_serializer.errors,
+                    "details": e.detail,
                 },
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        return self._process_video(request_serializer.validated_data)
+        return self._queue_video(validated_data)
 
-    def _process_video(self, validated_data):
-        """Process the video with validated data."""
+    def _queue_video(self, validated_data):
+        """Send the validated request to a worker and describe the new job."""
         video_url = validated_data["video_url"]
         styles = validated_data.get("styles")
         output_language = validated_data.get("output_language", "English")
 
-        try:
-            # Initialize the video processing service
-            service = VideoProcessingService()
+        cache_key = result_cache_key(video_url, styles, output_language)
+        cached_response = cache.get(cache_key)
+        if cached_response is not None:
+            logger.info("Returning cached result for URL: %s", video_url)
+            return Response(cached_response, status=status.HTTP_200_OK)
+
+        # Videos whose styles are all stored already need no worker at all
+        stored_result = self._find_stored_result(video_url, styles, output_language)
+        if stored_result is not None:
+            return self._create_success_response(stored_result, video_url, cache_key)
+
+        job = VideoProcessingJob.objects.create(
+            video_url=video_url,
+            styles=styles,
+            output_language=output_language,
+        )
+        # The worker reads the job, so it must not run before the row commits
+        transaction.on_commit(functools.partial(route_video_task.delay, str(job.pk)))
+        logger.info("Queued video processing job %s for URL: %s", job.pk, video_url)
+
+        return Response(
+            {
+                "status": "accepted",
+                "job_id": str(job.pk),
+                "status_url": reverse(
+                    "video_processor:video-job-status",
+                    kwargs={"job_id": job.pk},
+                ),
+            },
+            status=status.HTTP_202_ACCEPTED,
+        )
 
-            # Process the video
-            logger.info("Starting video processing for URL: %s", video_url)
-            result_data = service.process_video(
+    def _find_stored_result(self, video_url, styles, output_language):
+        """Look up a stored result, treating service errors as a miss."""
+        try:
+            return get_service().find_stored_result(
                 video_url=video_url,
                 styles=styles,
                 output_language=output_language,
             )
+        except VideoProcessorError as e:
+            # The worker hits the same error and reports it through the job
+            logger.warning("Stored result lookup failed: %s", e.message)
+            return None
 
-            # Format and return successful response
-            return self._create_success_response(result_data, video_url)
 
-        except (VideoValidationError, ProcessingTimeoutError) as e:
-            log_level = logger.warning
-            log_level("Processing error: %s", e.message)
-            return self._error_response(e.message, e.status_code)
+class VideoJobStatusAPIView(SingleRendererMixin, VideoResponseMixin, APIView):
+    """
+    API endpoint reporting the state of a queued video processing job.
 
-        except (ConfigurationError, ExternalServiceError) as e:
-            logger.exception("Service error: %s", e.message)
-            return self._error_response(e.message, e.status_code)
+    Finished jobs return the same payloads the processing endpoint returned
+    when videos were processed inside the request.
+    """
 
-        except Exception:
-            logger.exception("Unexpected error during video processing")
-            return self._error_response(
-                "An unexpected error occurred during video processing",
-                status.HTTP_500_INTERNAL_SERVER_ERROR,
-            )
+    permission_classes = [AllowAny]
+    # Clients poll this endpoint, so polls must not use up the request quota
+    throttle_classes: list[type[BaseThrottle]] = []
+    renderer_classes = [ORJSONRenderer]
 
-    def _create_success_response(self, result_data, video_url):
-        """Create and validate a success response."""
-        response_data = {
-            "status": "success",
-            "data": result_data,
-        }
+    def get(self, request, job_id):
+        """
+        Return the job's state, or its outcome once the worker has finished.
 
-        # Validate response format
-        response_serializer = VideoProcessResponseSerializer(data=response_data)
-        if response_serializer.is_valid():
-            logger.info(
-                "Video processing completed successfully for URL: %s",
-                video_url,
-            )
+        Returns:
+        - 200: Job still pending or processing, or its processed video results
+        - 304: Job unchanged since the response tagged with If-None-Match
+        - 400: Invalid video URL
+        - 404: Unknown job
+        - 422: Processing timeout, including jobs whose worker died
+        - 500: Configuration error
+        - 502: External service error
+        """
+        job = get_object_or_404(VideoProcessingJob, pk=job_id)
+        if job.is_abandoned:
+            # The worker was killed (hard time limit, out of memory) before it
+            # could record the outcome, so the timeout is recorded here
+            error = ProcessingTimeoutError("Video processing timed out")
+            job.mark_failure(error.message, error.status_code)
+        # Every state change saves the job, so its modification time tags the
+        # response, and repeated polls are answered without building the body
+        etag = quote_etag(f"{job.pk.hex}-{job.updated_at.timestamp()}")
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            response = self._job_response(job)
+        response["ETag"] = etag
+        return response
+
+    def _job_response(self, job):
+        """Build the response describing the job's current state."""
+        if job.status == VideoProcessingJob.Status.SUCCESS:
+            # The task stored the validated data it cached, so polls return
+            # the payload cache hits do, without validating it again
             return Response(
-                response_serializer.validated_data,
+                {"status": "success", "data": job.result},
                 status=status.HTTP_200_OK,
             )
 
-        logger.error(
-            "Response serialization failed: %s",
-            response_serializer.errors,
-        )
-        return self._error_response(
-            "Response formatting error",
-            status.HTTP_500_INTERNAL_SERVER_ERROR,
-        )
-
-    def _error_response(self, message: str, status_code: int) -> Response:
-        """
-        Create a standardized error response.
-
-        Args:
-            message: Error message to return
-            status_code: HTTP status code
-
-        Returns:
-            Response: Formatted error response
-        """
-        error_data = {
-            "status": "error",
-            "error": message,
-            "code": status_code,
-        }
+        if job.status == VideoProcessingJob.Status.FAILURE:
+            return self._error_response(job.error_message, job.error_code)
 
-        # Validate error response format
-        error_serializer = ErrorResponseSerializer(data=error_data)
-        if error_serializer.is_valid():
-            return Response(error_serializer.validated_data, status=status_code)
-        # Fallback if error serializer fails
         return Response(
-            {"status": "error", "error": message},
-            status=status_code,
+            {"status": job.status, "job_id": str(job.pk)},
+            status=status.HTTP_200_OK,
         )